@@ -6,6 +6,7 @@ It handles fetching beacon state data, block headers, and data sanitization.
 """
 
 import os
+import orjson
 import requests
 import logging
 from typing import Dict, Any, Optional
@@ -64,12 +65,16 @@ class BeaconAPIClient:
         
         logger.info(f"Initialized BeaconAPIClient with base_url: {self.base_url}")
     
-    def get_beacon_state(self, slot: str = "head") -> Dict[str, Any]:
+    def get_beacon_state(self, slot: str = "head", sanitize: bool = True) -> Dict[str, Any]:
         """
         Fetch beacon state from the API.
         
         Args:
             slot: Slot identifier ("head", "finalized", or specific slot number)
+            sanitize: Whether to return a sanitized copy of the response. Callers
+                that only pass the state to process_state_dict can skip it, as
+                that already converts keys and hex values while building the
+                containers, and the copy doubles the response in memory.
             
         Returns:
             Beacon state data as dictionary
@@ -84,13 +89,16 @@ class BeaconAPIClient:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             if 'data' not in data:
                 raise BeaconAPIError(f"Invalid response format: missing 'data' field")
             
             # Return in same format as raw request for same processing later
             logger.info(f"Successfully fetched beacon state for slot {slot}")
             
+            if not sanitize:
+                return data
+            
             # Sanitize the entire response (including the data wrapper)
             return self.sanitize_beacon_data(data)
             
@@ -142,7 +150,7 @@ class BeaconAPIClient:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             if 'data' not in data:
                 raise BeaconAPIError(f"Invalid response format: missing 'data' field")
                 
@@ -6,19 +6,19 @@ for validators and balances with full OpenAPI documentation.
 """
 
 import logging
-import traceback
-from typing import Optional
+import threading
+from typing import Any, Dict, List, Optional
 from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+import orjson
 import uvicorn
 
-import json
-import tempfile
-import os
 import time
 from .beacon_client import BeaconAPIClient, BeaconAPIError
-from ..main import ProofCombinedResult, generate_validator_and_balance_proofs
+from ..main import ProofCombinedResult, generate_validator_and_balance_proofs_from_state
+from ..ssz.containers.utils import process_state_dict
+from ..ssz.utils import bytes_to_hex, bytes_list_to_hex
 from ..models.api_models import (
     ErrorResponse, 
     HealthResponse,
@@ -77,25 +77,59 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global beacon client instance
+# Global beacon client instance, created once per process
 beacon_client = None
+_beacon_client_lock = threading.Lock()
 
 
 def get_beacon_client() -> BeaconAPIClient:
     """Dependency to get the beacon client instance."""
     global beacon_client
     if beacon_client is None:
-        beacon_client = BeaconAPIClient()
+        # Sync endpoints run in a thread pool, so guard construction to avoid
+        # building several clients (and connection pools) on first use
+        with _beacon_client_lock:
+            if beacon_client is None:
+                beacon_client = BeaconAPIClient()
     return beacon_client
 
 
+def _resolve_validator_index(validators: List[Dict[str, Any]], identifier: str) -> int:
+    """
+    Resolve a validator identifier to its index in the validator registry.
+    
+    Args:
+        validators: Sanitized validator entries from the beacon state
+        identifier: Validator index (e.g. "42") or 48-byte pubkey with 0x prefix
+        
+    Returns:
+        Index of the validator in the registry
+        
+    Raises:
+        ValueError: If the pubkey is unknown or the index is out of range
+    """
+    if identifier.startswith('0x') and len(identifier) == 98:
+        # Search for validator by pubkey
+        pubkey_lower = identifier.lower()
+        for idx, validator in enumerate(validators):
+            if validator.get('pubkey', '').lower() == pubkey_lower:
+                return idx
+        raise ValueError(f"Validator with pubkey {identifier} not found")
+    
+    # Parse as integer index
+    validator_index = int(identifier)
+    if validator_index < 0 or validator_index >= len(validators):
+        raise ValueError(f"Validator index {validator_index} out of range (0-{len(validators)-1})")
+    return validator_index
+
+
 @app.exception_handler(ValueError)
 async def value_error_handler(request, exc: ValueError):
     """Handle validation errors."""
     logger.error(f"Validation error: {exc}")
     return JSONResponse(
         status_code=400,
-        content=ErrorResponse(
+        content=ErrorResponse.model_construct(
             error=str(exc),
             code="VALIDATION_ERROR",
             details={"error_type": "ValueError"}
@@ -109,7 +143,7 @@ async def beacon_api_exception_handler(request, exc: BeaconAPIError):
     logger.error(f"Beacon API error: {exc}")
     return JSONResponse(
         status_code=502,
-        content=ErrorResponse(
+        content=ErrorResponse.model_construct(
             error=str(exc),
             code="BEACON_API_ERROR", 
             details={"error_type": "BeaconAPIError"}
@@ -120,10 +154,10 @@ async def beacon_api_exception_handler(request, exc: BeaconAPIError):
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc: Exception):
     """Handle unexpected errors."""
-    logger.error(f"Unexpected error: {exc}\n{traceback.format_exc()}")
+    logger.error("Unexpected error: %s", exc, exc_info=exc)
     return JSONResponse(
         status_code=500,
-        content=ErrorResponse(
+        content=ErrorResponse.model_construct(
             error="Internal server error",
             code="INTERNAL_ERROR",
             details={"error_type": type(exc).__name__}
@@ -154,14 +188,14 @@ async def health_check(client: BeaconAPIClient = Depends(get_beacon_client)):
         # Check beacon API connectivity
         beacon_status = client.health_check()
         
-        return HealthResponse(
+        return HealthResponse.model_construct(
             status="healthy",
             beacon_api=beacon_status,
             version="1.0.0"
         )
     except Exception as e:
         logger.warning(f"Health check failed: {e}")
-        return HealthResponse(
+        return HealthResponse.model_construct(
             status="degraded",
             beacon_api=False,
             version="1.0.0"
@@ -212,66 +246,49 @@ async def generate_combined_proof(
             state_data['pending_partial_withdrawals'] = []
         
         # Resolve identifier to index
-        if request.identifier.startswith('0x') and len(request.identifier) == 98:
-            # Search for validator by pubkey
-            pubkey_lower = request.identifier.lower()
-            validator_index = None
-            for idx, validator in enumerate(validators):
-                if validator.get('pubkey', '').lower() == pubkey_lower:
-                    validator_index = idx
-                    break
-            if validator_index is None:
-                raise ValueError(f"Validator with pubkey {request.identifier} not found")
-        else:
-            # Parse as integer index
-            validator_index = int(request.identifier)
-            if validator_index < 0 or validator_index >= len(validators):
-                raise ValueError(f"Validator index {validator_index} out of range (0-{len(validators)-1})")
+        validator_index = _resolve_validator_index(validators, request.identifier)
         
-        # Save state to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump({"data": state_data}, f)
-            temp_file = f.name
+        # Generate combined proof straight from the fetched state
+        logger.info(f"Generating proof for validator {validator_index}")
+        state = process_state_dict(state_data)
+        result: ProofCombinedResult = generate_validator_and_balance_proofs_from_state(state, validator_index)
         
-        try:
-            # Generate combined proof using main.py
-            logger.info(f"Generating proof for validator {validator_index} using temp file {temp_file}")
-            result: ProofCombinedResult = generate_validator_and_balance_proofs(temp_file, validator_index)
-            
-            # Add timestamp information to metadata
-            if 'timestamp' in result.metadata:
-                result.metadata['age_seconds'] = int(time.time() - result.metadata['timestamp'])
-            
-            # Add actual slot number to metadata
-            result.metadata['slot'] = result.header.get('slot', state_data.get('slot'))
-            
-            # Convert ProofCombinedResult to response format
-            return CombinedProofResponse(
-                balance_proof=[f"0x{step.hex()}" for step in result.balance_proof],
-                validator_proof=[f"0x{step.hex()}" for step in result.validator_proof],
-                state_root=result.header['state_root'],  # Already has 0x prefix
-                balance_leaf=f"0x{result.balance_leaf.hex()}",
-                balances_root=f"0x{result.balances_root.hex()}",
-                validator_index=result.validator_index,
-                header=result.header,
-                header_root=f"0x{result.header_root.hex()}",
-                validator_data=result.validator_data,
-                metadata=result.metadata
-            )
-        finally:
-            # Clean up temporary file
-            os.unlink(temp_file)
+        # Add timestamp information to metadata
+        if 'timestamp' in result.metadata:
+            result.metadata['age_seconds'] = int(time.time() - result.metadata['timestamp'])
+        
+        # Add actual slot number to metadata
+        result.metadata['slot'] = result.header.get('slot', state_data.get('slot'))
+        
+        # Convert ProofCombinedResult to response format. The fields are
+        # built from trusted proof output, so encode them directly with
+        # orjson instead of re-validating through CombinedProofResponse.
+        return Response(
+            content=orjson.dumps({
+                "balance_proof": bytes_list_to_hex(result.balance_proof),
+                "validator_proof": bytes_list_to_hex(result.validator_proof),
+                "state_root": result.header['state_root'],  # Already has 0x prefix
+                "balance_leaf": bytes_to_hex(result.balance_leaf),
+                "balances_root": bytes_to_hex(result.balances_root),
+                "validator_index": result.validator_index,
+                "header_root": bytes_to_hex(result.header_root),
+                "header": result.header,
+                "validator_data": result.validator_data,
+                "metadata": result.metadata
+            }),
+            media_type="application/json"
+        )
             
     except ValueError:
         raise
     except BeaconAPIError:
         raise
     except Exception as e:
-        logger.error(f"Error in combined proof endpoint: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.exception("Error in combined proof endpoint")
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
 
-@app.get("/proofs/combined/{identifier}")
+@app.get("/proofs/combined/{identifier}", response_model=CombinedProofResponse)
 async def generate_combined_proof_get(
     identifier: str,
     slot: str = "head",
@@ -295,10 +312,7 @@ async def generate_combined_proof_get(
         prev_block_root=prev_block_root
     )
     
-    result = await generate_combined_proof(request, client)
-    
-    # Convert response to dict for GET endpoint
-    return result.model_dump()
+    return await generate_combined_proof(request, client)
 
 
 def run_server(host: str = "127.0.0.1", port: int = 8000, dev: bool = False):
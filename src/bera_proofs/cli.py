@@ -8,35 +8,70 @@ Provides interactive and script-friendly commands for proof generation.
 
 import os
 import sys
-import json
 import logging
-from typing import Optional, List, Dict, Any, Tuple
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple, Callable, Union
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Prompt, IntPrompt, Confirm
-from rich.syntax import Syntax
+import orjson
 
 # Add src to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from bera_proofs.api.beacon_client import BeaconAPIClient, BeaconAPIError
-from bera_proofs.api.rest_api import run_server
 from bera_proofs.visualize_merkle import visualize_merkle_proof, demo_visualization
-from bera_proofs.ssz.containers.utils import load_and_process_state
-from bera_proofs.main import generate_validator_proof, generate_balance_proof, generate_validator_and_balance_proofs
+from bera_proofs.ssz.containers.utils import process_state_dict
+from bera_proofs.ssz.utils import bytes_to_hex, bytes_list_to_hex
+from bera_proofs.main import (
+    load_and_process_state,
+    ProofResult,
+    generate_validator_proof,
+    generate_balance_proof,
+    generate_validator_and_balance_proofs,
+    generate_validator_proof_from_state,
+    generate_balance_proof_from_state,
+    generate_validator_and_balance_proofs_from_state,
+)
+
+
+class _LazyConsole:
+    """
+    Stand-in for the module's rich Console that creates it on first use.
+    
+    rich (and the REST API stack, imported in serve) are only loaded by the
+    commands that need them, so JSON proof output starts without them.
+    """
+    _console = None
+    
+    def __getattr__(self, name: str) -> Any:
+        if _LazyConsole._console is None:
+            from rich.console import Console
+            _LazyConsole._console = Console()
+        return getattr(_LazyConsole._console, name)
+
 
 # Configure rich console
-console = Console()
+console = _LazyConsole()
 logger = logging.getLogger(__name__)
 
 
-def extract_historical_roots_from_file(historical_state_file: str) -> Tuple[str, str]:
+@lru_cache(maxsize=8)
+def _historical_roots(path: str, mtime_ns: int, size: int) -> Tuple[str, str]:
+    """Roots at slot % 8 of a state file, cached per file version (mtime and size)."""
+    state = load_and_process_state(path)
+    # Extract roots from position (slot % 8) as per ETH2 spec
+    idx = state.slot & 7
+    return bytes_to_hex(state.state_roots[idx]), bytes_to_hex(state.block_roots[idx])
+
+
+def extract_historical_roots_from_file(historical_state_file: Union[str, Path]) -> Tuple[str, str]:
     """
     Extract state and block roots from a historical state file.
     
+    Results are cached in-process, so repeated proofs against the same
+    unchanged file do not load it again.
+    
     Args:
         historical_state_file: Path to the historical state JSON file
         
@@ -44,40 +79,137 @@ def extract_historical_roots_from_file(historical_state_file: str) -> Tuple[str,
         Tuple of (state_root, block_root) as hex strings with 0x prefix
     """
     try:
-        state = load_and_process_state(historical_state_file)
-        # Extract roots from position (slot % 8) as per ETH2 spec
-        state_root = f"0x{state.state_roots[state.slot % 8].hex()}"
-        block_root = f"0x{state.block_roots[state.slot % 8].hex()}"
-        return state_root, block_root
+        st = os.stat(historical_state_file)
+        return _historical_roots(os.path.realpath(historical_state_file), st.st_mtime_ns, st.st_size)
     except Exception as e:
         raise click.ClickException(f"Failed to extract historical roots from {historical_state_file}: {e}")
 
 
+def _parse_slot(value: Any) -> int:
+    """Parse a slot given as an int, decimal string or 0x-prefixed hex string."""
+    if isinstance(value, str) and value.startswith('0x'):
+        return int(value, 16)
+    return int(value)
+
+
+_beacon_client: Optional[BeaconAPIClient] = None
+
+
+def _get_client() -> BeaconAPIClient:
+    """Shared BeaconAPIClient, created on first use so its HTTP session is reused."""
+    global _beacon_client
+    if _beacon_client is None:
+        _beacon_client = BeaconAPIClient()
+    return _beacon_client
+
+
+def _fetch_state_and_historical_roots(beacon_client: BeaconAPIClient, slot_id: Any,
+                                      fetch_roots: bool) -> Tuple[Dict[str, Any], Optional[int], Optional[Tuple[str, str]]]:
+    """
+    Fetch a beacon state and, optionally, the roots from 8 slots before it.
+    
+    The historical roots are looked up on a worker thread while the (large)
+    state downloads on the calling thread, so a named slot such as "head"
+    costs no extra round trip before the state request. If the named slot
+    moved on between the two lookups, the roots are refetched for the slot
+    the state was actually taken at.
+    
+    Args:
+        beacon_client: Client used for all requests
+        slot_id: Slot number or named slot ("head", "finalized")
+        fetch_roots: Whether to fetch the historical roots as well
+        
+    Returns:
+        Tuple of (state_response, current_slot, (prev_state_root, prev_block_root)),
+        where the last two are None if the roots were not fetched
+    """
+    if not fetch_roots:
+        return beacon_client.get_beacon_state(slot_id, sanitize=False), None, None
+    
+    def slot_and_roots() -> Tuple[int, Tuple[str, str]]:
+        # Numeric slots need no lookup; named ones are resolved via their header
+        if isinstance(slot_id, int):
+            slot_number = slot_id
+        else:
+            header = beacon_client.get_beacon_header(slot_id)
+            slot_number = _parse_slot(header['header']['message']['slot'])
+        return slot_number, beacon_client.get_historical_roots(slot_number)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        roots_future = executor.submit(slot_and_roots)
+        state_response = beacon_client.get_beacon_state(slot_id, sanitize=False)
+        try:
+            roots_slot, roots = roots_future.result()
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not auto-fetch historical data: {e}[/yellow]")
+            return state_response, None, None
+    
+    current_slot = _parse_slot(state_response['data']['slot'])
+    if roots_slot != current_slot:
+        roots = beacon_client.get_historical_roots(current_slot)
+    return state_response, current_slot, roots
+
+
 def setup_logging(verbose: bool = False):
     """Setup logging configuration."""
-    level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    # Records never report thread/process info, so skip collecting it
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
+    if verbose:
+        level = logging.DEBUG
+        logging.basicConfig(
+            level=level,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+    else:
+        # Only warnings and errors; info/debug calls are rejected by the level
+        # check before any record is built. No timestamp on the default path.
+        level = logging.WARNING
+        logging.basicConfig(level=level, format='%(levelname)s %(name)s: %(message)s')
+    
+    # basicConfig is a no-op when handlers already exist (bera_proofs.main
+    # configures logging on import), so apply the level explicitly
+    logging.getLogger().setLevel(level)
+    
+    # HTTP client internals are noise even when debugging the CLI
+    logging.getLogger("urllib3").setLevel(logging.WARNING)
+
+
+# (header, style) column specs of the tables printed by the CLI
+_PROPERTY_COLUMNS = (("Property", "cyan"), ("Value", "green"))
+_HEALTH_COLUMNS = (("Component", "cyan"), ("Status", "green"), ("Details", None))
+_VALIDATOR_COLUMNS = (("Index", "cyan"), ("Pubkey", "green"), ("Balance", "yellow"))
+
+# Hex characters in a BLS pubkey (bytes48)
+_PUBKEY_HEX_LEN = 96
+
+
+def _make_table(columns: Tuple[Tuple[str, Optional[str]], ...], title: Optional[str] = None) -> Any:
+    """Build a rich Table with the given columns."""
+    from rich.table import Table
+    
+    table = Table(title=title)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    return table
 
 
 def print_proof_result(result, proof_type: str, format_output: str = "table"):
     """Print proof results in various formats."""
     if format_output == "json":
         output = {
-            "proof": [step.hex() for step in result.proof],
+            "proof": bytes_list_to_hex(result.proof, prefix=False),
             "root": result.root.hex(),
             "metadata": result.metadata,
             "proof_type": proof_type
         }
-        console.print_json(json.dumps(output, indent=2))
+        console.print_json(orjson.dumps(output).decode())
         return
     
     # Table format (default)
-    table = Table(title=f"{proof_type.title()} Proof Results")
-    table.add_column("Property", style="cyan")
-    table.add_column("Value", style="green")
+    table = _make_table(_PROPERTY_COLUMNS, title=f"{proof_type.title()} Proof Results")
     
     table.add_row("Proof Type", proof_type)
     table.add_row("Root Hash", result.root.hex())
@@ -98,8 +230,15 @@ def print_proof_result(result, proof_type: str, format_output: str = "table"):
 
 
 def format_proof_result(result_dict: Dict[str, Any]) -> str:
-    """Format proof result for JSON output."""
-    return json.dumps(result_dict, indent=2)
+    """
+    Format proof result for JSON output.
+    
+    Indented for a terminal; compact when stdout is piped or redirected,
+    where the output is read by tools such as jq rather than by eye.
+    """
+    if sys.stdout.isatty():
+        return orjson.dumps(result_dict, option=orjson.OPT_INDENT_2).decode()
+    return orjson.dumps(result_dict).decode()
 
 
 @click.group()
@@ -119,31 +258,39 @@ def cli(ctx, verbose: bool, api_url: Optional[str]):
     ctx.obj['api_url'] = api_url
 
 
-@cli.command()
-@click.argument('validator_index', type=int)
-@click.option('--json-file', type=str, help='Path to current beacon state JSON file')
-@click.option('--historical-state-file', type=str, help='Path to historical beacon state JSON file (8 slots ago). Alternative to --prev-state-root/--prev-block-root')
-@click.option('--slot', type=int, help='Slot number for API queries (defaults to head)')
-@click.option('--prev-state-root', type=str, help='Previous state root from 8 slots ago (hex string). Ignored if --historical-state-file is provided')
-@click.option('--prev-block-root', type=str, help='Previous block root from 8 slots ago (hex string). Ignored if --historical-state-file is provided')
-@click.option('--auto-fetch', is_flag=True, default=True, help='Auto-fetch historical data from API if not provided via other options')
-def validator(validator_index: int, json_file: str = None, historical_state_file: str = None, slot: int = None, 
-              prev_state_root: str = None, prev_block_root: str = None, auto_fetch: bool = True):
+# State file options are checked once by click and passed on as Path objects
+_STATE_FILE = click.Path(exists=True, dir_okay=False, path_type=Path)
+
+
+def _proof_options(command: Callable) -> Callable:
+    """Arguments and options shared by the validator and balance commands."""
+    decorators = [
+        click.argument('validator_index', type=int),
+        click.option('--json-file', type=_STATE_FILE, help='Path to current beacon state JSON file'),
+        click.option('--historical-state-file', type=_STATE_FILE, help='Path to historical beacon state JSON file (8 slots ago). Alternative to --prev-state-root/--prev-block-root'),
+        click.option('--slot', type=int, help='Slot number for API queries (defaults to head)'),
+        click.option('--prev-state-root', type=str, help='Previous state root from 8 slots ago (hex string). Ignored if --historical-state-file is provided'),
+        click.option('--prev-block-root', type=str, help='Previous block root from 8 slots ago (hex string). Ignored if --historical-state-file is provided'),
+        click.option('--auto-fetch', is_flag=True, default=True, help='Auto-fetch historical data from API if not provided via other options'),
+    ]
+    for decorator in reversed(decorators):
+        command = decorator(command)
+    return command
+
+
+def _run_proof_command(from_file: Callable[..., ProofResult], from_state: Callable[..., ProofResult],
+                       proof_type: str, validator_index: int, json_file: Optional[Path],
+                       historical_state_file: Optional[Path], slot: Optional[int],
+                       prev_state_root: Optional[str], prev_block_root: Optional[str], auto_fetch: bool):
     """
-    Generate a validator existence proof.
-    
-    VALIDATOR_INDEX: Index of the validator to prove
-    
-    Historical Data Options (choose one):
+    Shared body of the single-proof commands (validator, balance).
     
-    1. --historical-state-file: Provide a state file from 8 slots ago
-       Example: --historical-state-file historical_state.json
-    
-    2. --prev-state-root and --prev-block-root: Provide explicit hex values
-       Example: --prev-state-root 0x123... --prev-block-root 0x456...
-    
-    3. --auto-fetch: Let the tool fetch historical data from the beacon API
-       (Default behavior when using API mode)
+    Args:
+        from_file: Proof generator taking a state file path
+        from_state: Proof generator taking an already loaded BeaconState
+        proof_type: Value of metadata "type" in the output, e.g. "validator_proof"
+        
+    The remaining arguments are the command's options, see validator().
     """
     try:
         # Handle historical data precedence: file > explicit roots > auto-fetch
@@ -167,80 +314,73 @@ def validator(validator_index: int, json_file: str = None, historical_state_file
             #     )
             
             # Use local JSON file directly
-            result = generate_validator_proof(json_file, validator_index, prev_state_root, prev_block_root)
-            
-            # Format for JSON output
-            output = {
-                "proof": [f"0x{step.hex()}" for step in result.proof],
-                "root": f"0x{result.root.hex()}",
-                "metadata": {
-                    **result.metadata,
-                    "type": "validator_proof"
-                }
-            }
+            result = from_file(json_file, validator_index, prev_state_root, prev_block_root)
         else:
             # Use API with optional auto-fetching
-            beacon_client = BeaconAPIClient()
+            beacon_client = _get_client()
             slot_id = slot if slot is not None else "head"
             
             # If auto-fetch is enabled and historical roots not provided, get them from API
-            if auto_fetch and (prev_state_root is None or prev_block_root is None):
-                try:
-                    # Get current slot for historical calculation
-                    state_response = beacon_client.get_state(slot_id)
-                    current_slot = int(state_response.get('slot', '0'), 16 if isinstance(state_response.get('slot'), str) and state_response.get('slot').startswith('0x') else 10)
-                    
-                    # Fetch historical roots
-                    fetched_state_root, fetched_block_root = beacon_client.get_historical_roots(current_slot)
-                    if prev_state_root is None:
-                        prev_state_root = fetched_state_root
-                    if prev_block_root is None:
-                        prev_block_root = fetched_block_root
-                    
-                    console.print(f"[green]Auto-fetched historical data from slot {current_slot - 8}[/green]")
-                except Exception as e:
-                    console.print(f"[yellow]Warning: Could not auto-fetch historical data: {e}[/yellow]")
-            
-            # Get state data and save to temp file
-            state_response = beacon_client.get_state(slot_id)
-            
-            temp_file = "temp_state.json"
-            with open(temp_file, "w") as f:
-                json.dump(state_response, f)
-            
-            try:
-                result = generate_validator_proof(temp_file, validator_index, prev_state_root, prev_block_root)
+            fetch_roots = auto_fetch and (prev_state_root is None or prev_block_root is None)
+            state_response, current_slot, fetched_roots = _fetch_state_and_historical_roots(
+                beacon_client, slot_id, fetch_roots
+            )
+            if fetched_roots is not None:
+                fetched_state_root, fetched_block_root = fetched_roots
+                if prev_state_root is None:
+                    prev_state_root = fetched_state_root
+                if prev_block_root is None:
+                    prev_block_root = fetched_block_root
                 
-                # Format for JSON output
-                output = {
-                    "proof": [f"0x{step.hex()}" for step in result.proof],
-                    "root": f"0x{result.root.hex()}",
-                    "metadata": {
-                        **result.metadata,
-                        "type": "validator_proof"
-                    }
-                }
-            finally:
-                # Clean up temp file
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
+                console.print(f"[green]Auto-fetched historical data from slot {current_slot - 8}[/green]")
+            
+            # Build the state directly from the API response
+            state = process_state_dict(state_response["data"])
+            result = from_state(state, validator_index, prev_state_root, prev_block_root)
         
+        # Format for JSON output
+        metadata = dict(result.metadata)
+        metadata["type"] = proof_type
+        output = {
+            "proof": bytes_list_to_hex(result.proof),
+            "root": bytes_to_hex(result.root),
+            "metadata": metadata
+        }
         print(format_proof_result(output))
         
     except Exception as e:
-        logger.error(f"Error generating validator proof: {e}")
+        logger.error(f"Error generating {proof_type.replace('_', ' ')}: {e}")
         raise click.ClickException(str(e))
 
 
 @cli.command()
-@click.argument('validator_index', type=int)
-@click.option('--json-file', type=str, help='Path to current beacon state JSON file')
-@click.option('--historical-state-file', type=str, help='Path to historical beacon state JSON file (8 slots ago). Alternative to --prev-state-root/--prev-block-root')
-@click.option('--slot', type=int, help='Slot number for API queries (defaults to head)')
-@click.option('--prev-state-root', type=str, help='Previous state root from 8 slots ago (hex string). Ignored if --historical-state-file is provided')
-@click.option('--prev-block-root', type=str, help='Previous block root from 8 slots ago (hex string). Ignored if --historical-state-file is provided')
-@click.option('--auto-fetch', is_flag=True, default=True, help='Auto-fetch historical data from API if not provided via other options')
-def balance(validator_index: int, json_file: str = None, historical_state_file: str = None, slot: int = None,
+@_proof_options
+def validator(validator_index: int, json_file: Path = None, historical_state_file: Path = None, slot: int = None, 
+              prev_state_root: str = None, prev_block_root: str = None, auto_fetch: bool = True):
+    """
+    Generate a validator existence proof.
+    
+    VALIDATOR_INDEX: Index of the validator to prove
+    
+    Historical Data Options (choose one):
+    
+    1. --historical-state-file: Provide a state file from 8 slots ago
+       Example: --historical-state-file historical_state.json
+    
+    2. --prev-state-root and --prev-block-root: Provide explicit hex values
+       Example: --prev-state-root 0x123... --prev-block-root 0x456...
+    
+    3. --auto-fetch: Let the tool fetch historical data from the beacon API
+       (Default behavior when using API mode)
+    """
+    _run_proof_command(generate_validator_proof, generate_validator_proof_from_state, "validator_proof",
+                       validator_index, json_file, historical_state_file, slot,
+                       prev_state_root, prev_block_root, auto_fetch)
+
+
+@cli.command()
+@_proof_options
+def balance(validator_index: int, json_file: Path = None, historical_state_file: Path = None, slot: int = None,
             prev_state_root: str = None, prev_block_root: str = None, auto_fetch: bool = True):
     """
     Generate a validator balance proof.
@@ -258,99 +398,17 @@ def balance(validator_index: int, json_file: str = None, historical_state_file:
     3. --auto-fetch: Let the tool fetch historical data from the beacon API
        (Default behavior when using API mode)
     """
-    try:
-        # Handle historical data precedence: file > explicit roots > auto-fetch
-        if historical_state_file:
-            if not json_file:
-                raise click.ClickException("--historical-state-file requires --json-file to be specified")
-            
-            console.print(f"[cyan]Extracting historical roots from {historical_state_file}[/cyan]")
-            prev_state_root, prev_block_root = extract_historical_roots_from_file(historical_state_file)
-            console.print(f"[green]Extracted state_root: {prev_state_root}[/green]")
-            console.print(f"[green]Extracted block_root: {prev_block_root}[/green]")
-        
-        if json_file:
-            # # For file-based operations, historical data is mandatory for correct state root computation
-            # if not historical_state_file and (not prev_state_root or not prev_block_root):
-            #     raise click.ClickException(
-            #         "Historical data is required when using --json-file. Please provide either:\n"
-            #         "  1. --historical-state-file path/to/historical_state.json\n"
-            #         "  2. Both --prev-state-root 0x123... and --prev-block-root 0x456...\n\n"
-            #         "Historical data from 8 slots ago is required to generate the correct state root."
-            #     )
-            
-            # Use local JSON file directly
-            result = generate_balance_proof(json_file, validator_index, prev_state_root, prev_block_root)
-            
-            # Format for JSON output
-            output = {
-                "proof": [f"0x{step.hex()}" for step in result.proof],
-                "root": f"0x{result.root.hex()}",
-                "metadata": {
-                    **result.metadata,
-                    "type": "balance_proof"
-                }
-            }
-        else:
-            # Use API with optional auto-fetching
-            beacon_client = BeaconAPIClient()
-            slot_id = slot if slot is not None else "head"
-            
-            # If auto-fetch is enabled and historical roots not provided, get them from API
-            if auto_fetch and (prev_state_root is None or prev_block_root is None):
-                try:
-                    # Get current slot for historical calculation
-                    state_response = beacon_client.get_state(slot_id)
-                    current_slot = int(state_response.get('slot', '0'), 16 if isinstance(state_response.get('slot'), str) and state_response.get('slot').startswith('0x') else 10)
-                    
-                    # Fetch historical roots
-                    fetched_state_root, fetched_block_root = beacon_client.get_historical_roots(current_slot)
-                    if prev_state_root is None:
-                        prev_state_root = fetched_state_root
-                    if prev_block_root is None:
-                        prev_block_root = fetched_block_root
-                    
-                    console.print(f"[green]Auto-fetched historical data from slot {current_slot - 8}[/green]")
-                except Exception as e:
-                    console.print(f"[yellow]Warning: Could not auto-fetch historical data: {e}[/yellow]")
-            
-            # Get state data and save to temp file
-            state_response = beacon_client.get_state(slot_id)
-            
-            temp_file = "temp_state.json"
-            with open(temp_file, "w") as f:
-                json.dump(state_response, f)
-            
-            try:
-                result = generate_balance_proof(temp_file, validator_index, prev_state_root, prev_block_root)
-                
-                # Format for JSON output
-                output = {
-                    "proof": [f"0x{step.hex()}" for step in result.proof],
-                    "root": f"0x{result.root.hex()}",
-                    "metadata": {
-                        **result.metadata,
-                        "type": "balance_proof"
-                    }
-                }
-            finally:
-                # Clean up temp file
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
-        
-        print(format_proof_result(output))
-        
-    except Exception as e:
-        logger.error(f"Error generating balance proof: {e}")
-        raise click.ClickException(str(e))
+    _run_proof_command(generate_balance_proof, generate_balance_proof_from_state, "balance_proof",
+                       validator_index, json_file, historical_state_file, slot,
+                       prev_state_root, prev_block_root, auto_fetch)
 
 
 @cli.command()
 @click.argument('validator_index', type=int)
-@click.option('--json-file', type=str, help='Path to current beacon state JSON file')
+@click.option('--json-file', type=_STATE_FILE, help='Path to current beacon state JSON file')
 @click.option('--slot', type=int, help='Slot number for API queries (defaults to head)')
 @click.option('--auto-fetch', is_flag=True, default=True, help='Auto-fetch historical data from API if not provided via other options')
-def combine(validator_index: int, json_file: str = None, historical_state_file: str = None, slot: int = None,
+def combine(validator_index: int, json_file: Path = None, historical_state_file: str = None, slot: int = None,
             prev_state_root: str = None, prev_block_root: str = None, auto_fetch: bool = True) -> Dict[str, Any]:
     """
     Generate a validator and balance proof.
@@ -372,58 +430,29 @@ def combine(validator_index: int, json_file: str = None, historical_state_file:
         if json_file:           
             # Use local JSON file directly
             result = generate_validator_and_balance_proofs(json_file, validator_index)
-            
-            # Format for JSON output
-            output = {
-                "balance_proof": [f"0x{step.hex()}" for step in result.balance_proof],
-                "validator_proof": [f"0x{step.hex()}" for step in result.validator_proof],
-                "state_root": f"0x{result.state_root.hex()}",
-                "balance_leaf": f"0x{result.balance_leaf.hex()}",
-                "balances_root": f"0x{result.balances_root.hex()}",
-                "validator_index": result.validator_index,
-                "header_root": f"0x{result.header_root.hex()}",
-                "header": {**result.header},
-                "validator_data": {**result.validator_data},
-                "metadata": {
-                    **result.metadata
-                }
-            }
-
         else:
             # Use API with optional auto-fetching
-            beacon_client = BeaconAPIClient()
+            beacon_client = _get_client()
             slot_id = slot if slot is not None else "head"
             
-            # Get state data and save to temp file
-            state_response = beacon_client.get_state(slot_id)
-            
-            temp_file = "temp_state.json"
-            with open(temp_file, "w") as f:
-                json.dump(state_response, f)
-            
-            try:
-                result = generate_validator_and_balance_proofs(temp_file, validator_index)
-                
-                # Format for JSON output
-                output = {
-                "balance_proof": [f"0x{step.hex()}" for step in result.balance_proof],
-                "validator_proof": [f"0x{step.hex()}" for step in result.validator_proof],
-                "state_root": f"0x{result.state_root.hex()}",
-                "balance_leaf": f"0x{result.balance_leaf.hex()}",
-                "balances_root": f"0x{result.balances_root.hex()}",
-                "validator_index": result.validator_index,
-                "header_root": f"0x{result.header_root.hex()}",
-                "header": {**result.header},
-                "validator_data": {**result.validator_data},
-                "metadata": {
-                    **result.metadata
-                }
-            }
-            finally:
-                # Clean up temp file
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
+            # Build the state directly from the API response
+            state_response = beacon_client.get_beacon_state(slot_id, sanitize=False)
+            state = process_state_dict(state_response["data"])
+            result = generate_validator_and_balance_proofs_from_state(state, validator_index)
         
+        # Format for JSON output
+        output = {
+            "balance_proof": bytes_list_to_hex(result.balance_proof),
+            "validator_proof": bytes_list_to_hex(result.validator_proof),
+            "state_root": bytes_to_hex(result.state_root),
+            "balance_leaf": bytes_to_hex(result.balance_leaf),
+            "balances_root": bytes_to_hex(result.balances_root),
+            "validator_index": result.validator_index,
+            "header_root": bytes_to_hex(result.header_root),
+            "header": {**result.header},
+            "validator_data": {**result.validator_data},
+            "metadata": dict(result.metadata)
+        }
         print(format_proof_result(output))
         return output
         
@@ -439,6 +468,9 @@ def combine(validator_index: int, json_file: str = None, historical_state_file:
 @click.pass_context
 def serve(ctx, host: str, port: int, dev: bool):
     """Start the REST API server."""
+    from rich.panel import Panel
+    from bera_proofs.api.rest_api import run_server
+    
     try:
         console.print(Panel(
             f"Starting Bera Proofs API Server\n\n"
@@ -488,6 +520,9 @@ def visualize(ctx, json_file: Optional[str], validator_index: Optional[int]):
 @click.pass_context
 def interactive(ctx):
     """Interactive mode for proof generation."""
+    from rich.panel import Panel
+    from rich.prompt import Prompt, IntPrompt, Confirm
+    
     console.print(Panel(
         "🔍 Welcome to Bera Proofs Interactive Mode\n\n"
         "This mode will guide you through generating Merkle proofs\n"
@@ -496,6 +531,12 @@ def interactive(ctx):
         border_style="blue"
     ))
     
+    # File-based and state-based generators for each proof type
+    generators = {
+        "validator": (generate_validator_proof, generate_validator_proof_from_state),
+        "balance": (generate_balance_proof, generate_balance_proof_from_state),
+    }
+    
     try:
         # Get proof type
         proof_types = ["validator", "balance", "quit"]
@@ -527,11 +568,16 @@ def interactive(ctx):
             # Generate proof
             console.print(f"\n[cyan]Generating {selected_type} proof...[/cyan]")
             
-            service = ProofService()
-            if selected_type == "validator":
-                result = service.get_validator_proof(validator_index, slot, json_file or "")
-            elif selected_type == "balance":
-                result = service.get_balances_proof(validator_index, slot, json_file or "")
+            from_file, from_state = generators[selected_type]
+            if json_file:
+                result = from_file(json_file, validator_index)
+            else:
+                beacon_client = _get_client()
+                slot_id = int(slot) if slot.isdigit() else slot
+                state_response, _, fetched_roots = _fetch_state_and_historical_roots(beacon_client, slot_id, True)
+                prev_state_root, prev_block_root = fetched_roots or (None, None)
+                state = process_state_dict(state_response["data"])
+                result = from_state(state, validator_index, prev_state_root, prev_block_root)
             
             print_proof_result(result, selected_type, "table")
             
@@ -555,13 +601,10 @@ def health(ctx):
     
     try:
         # Check beacon API
-        client = BeaconAPIClient()
+        client = _get_client()
         api_status = client.health_check()
         
-        table = Table(title="System Health Check")
-        table.add_column("Component", style="cyan")
-        table.add_column("Status", style="green")
-        table.add_column("Details")
+        table = _make_table(_HEALTH_COLUMNS, title="System Health Check")
         
         table.add_row(
             "Beacon API",
@@ -593,28 +636,30 @@ def inspect(ctx, json_file: str):
         
         state = load_and_process_state(json_file)
         
-        table = Table(title="Beacon State Information")
-        table.add_column("Property", style="cyan")
-        table.add_column("Value", style="green")
+        table = _make_table(_PROPERTY_COLUMNS, title="Beacon State Information")
         
         table.add_row("Slot", str(state.slot))
         table.add_row("Validators", str(len(state.validators)))
         table.add_row("Balances", str(len(state.balances)))
         table.add_row("Genesis Root", state.genesis_validators_root.hex()[:20] + "...")
-        table.add_row("State Root", state.merkle_root().hex()[:20] + "...")
+        # Merkleizing the whole state takes seconds; only do it when asked
+        if ctx.obj.get('verbose'):
+            table.add_row("State Root", state.merkle_root().hex()[:20] + "...")
+        else:
+            table.add_row("State Root", "(use --verbose to compute)")
         
         console.print(table)
         
         # Show first few validators
         if len(state.validators) > 0:
             console.print("\n[bold cyan]First 5 Validators:[/bold cyan]")
-            val_table = Table()
-            val_table.add_column("Index", style="cyan")
-            val_table.add_column("Pubkey", style="green")
-            val_table.add_column("Balance", style="yellow")
+            val_table = _make_table(_VALIDATOR_COLUMNS)
             
-            for i in range(min(5, len(state.validators))):
-                pubkey = state.validators[i].pubkey.hex()
+            # Hex-encode the shown pubkeys in one call and slice each row out
+            shown = state.validators[:5]
+            pubkeys_hex = b"".join(v.pubkey for v in shown).hex()
+            for i in range(len(shown)):
+                pubkey = pubkeys_hex[i * _PUBKEY_HEX_LEN:(i + 1) * _PUBKEY_HEX_LEN]
                 balance = str(state.balances[i]) if i < len(state.balances) else "N/A"
                 val_table.add_row(
                     str(i), 
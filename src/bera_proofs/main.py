@@ -6,36 +6,78 @@ by both CLI and API interfaces. Supports validator and balance proofs.
 """
 
 
-import json
+import copy
 import logging
-import math
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+import orjson
+
 from .ssz import (
     BeaconState, 
+    BeaconBlockHeader,
     Validator,
     ValidatorBalance,
+    batch_validator_roots,
     merkle_root_basic,
     get_proof,
-    get_fixed_capacity_proof,
-    compute_root_from_proof,
     build_merkle_tree,
-    merkle_list_tree,
-    VALIDATOR_REGISTRY_LIMIT
+    IncrementalMerkleTree,
+    VALIDATOR_REGISTRY_LIMIT,
+    BALANCE_CHUNK_LIMIT,
+    hex_to_bytes,
 )
 from .ssz.containers.utils import load_and_process_state as _load_state
+from .ssz.merkle._hashtree import HAS_NATIVE_HASHTREE
 
-def load_and_process_state(state_file: str) -> 'BeaconState':
-    """Load and process beacon state from JSON file."""
-    return _load_state(state_file)
+# latest_block_header.state_root as merkleized into the state it belongs to
+ZERO_STATE_ROOT = b"\x00" * 32
 
-from bera_proofs.ssz.merkle import (
-    get_fixed_capacity_proof,
-    merkle_list_tree
-)
+# Parsed states by (path, mtime, size), most recently used last. States are
+# large, so only a couple are kept.
+STATE_CACHE_SIZE = 2
+_state_cache: "OrderedDict[Tuple[str, int, int], BeaconState]" = OrderedDict()
+_state_cache_lock = threading.Lock()
+
+
+def _working_copy(state: BeaconState) -> BeaconState:
+    """Shallow copy of a cached state that owns every field proof generation writes to."""
+    working = copy.copy(state)
+    working.latest_block_header = copy.copy(state.latest_block_header)
+    working.state_roots = list(state.state_roots)
+    working.block_roots = list(state.block_roots)
+    return working
+
+
+def load_and_process_state(state_file: str) -> 'BeaconState':
+    """
+    Load and process beacon state from JSON file.
+    
+    Parsed states are cached in-process by path, modification time and size,
+    so repeated proofs over an unchanged file (interactive mode, inspect
+    followed by a proof) skip JSON parsing and SSZ decoding. Each call gets
+    its own copy of the header and root vectors, which proof generation
+    overwrites.
+    """
+    st = os.stat(state_file)
+    key = (os.path.realpath(state_file), st.st_mtime_ns, st.st_size)
+    with _state_cache_lock:
+        state = _state_cache.get(key)
+        if state is not None:
+            _state_cache.move_to_end(key)
+    if state is None:
+        state = _load_state(state_file)
+        with _state_cache_lock:
+            _state_cache[key] = state
+            while len(_state_cache) > STATE_CACHE_SIZE:
+                _state_cache.popitem(last=False)
+    return _working_copy(state)
 
 logger = logging.getLogger(__name__)
 
@@ -91,20 +133,125 @@ class ProofCombinedResult:
     metadata: Dict[str, Any]
 
 
+# List trees (validator registry, balance chunks) kept between calls;
+# consecutive states differ in only a few leaves, so syncing a tree is far
+# cheaper than rebuilding it
+_list_trees: Dict[str, IncrementalMerkleTree] = {}
+# One lock per tree, so proofs over different lists can run concurrently
+_list_tree_locks = {"validators": threading.Lock(), "balances": threading.Lock()}
+
+
+def _list_proof_and_root(name: str, leaves: List[bytes], index: int, capacity: int) -> Tuple[List[bytes], bytes]:
+    """Proof and root (without length mix-in) for a leaf of a cached fixed-capacity list tree."""
+    with _list_tree_locks[name]:
+        tree = _list_trees.get(name)
+        if tree is None or tree.capacity != capacity:
+            tree = _list_trees[name] = IncrementalMerkleTree(leaves, capacity)
+        else:
+            tree.sync(leaves)
+        return tree.proof(index), tree.root()
+
+
+def _validator_list_proof(state: BeaconState, validator_index: int) -> Tuple[List[bytes], bytes]:
+    """
+    Proof of a validator within the validators list.
+    
+    Returns:
+        Tuple of (proof including the length chunk, validators list root)
+    """
+    validator_elements = batch_validator_roots(state.validators)
+    val_proof, registry_root = _list_proof_and_root("validators", validator_elements, validator_index, VALIDATOR_REGISTRY_LIMIT)
+    
+    # Add length mixing
+    length_chunk = len(validator_elements).to_bytes(32, "little")
+    val_proof.append(length_chunk)
+    return val_proof, sha256(registry_root + length_chunk).digest()
+
+
+def _balance_list_proof(state: BeaconState, validator_index: int) -> Tuple[List[bytes], bytes, bytes]:
+    """
+    Proof of a validator's balance chunk within the balances list.
+    
+    Returns:
+        Tuple of (proof including the length chunk, balance leaf, balances list root)
+    """
+    # Balances are packed 4 per chunk (32 bytes / 8 bytes per uint64)
+    balances_blob = state.packed_balances
+    balance_chunks = [balances_blob[i:i + 32] for i in range(0, len(balances_blob), 32)]
+    
+    # The validator's balance is in chunk at index validator_index // 4
+    chunk_index = validator_index // 4
+    
+    balance_proof, balances_chunks_root = _list_proof_and_root(
+        "balances", balance_chunks, chunk_index, BALANCE_CHUNK_LIMIT
+    )
+    
+    # Add length mixing
+    length_chunk = len(state.balances).to_bytes(32, "little")
+    balance_proof.append(length_chunk)
+    balances_root = sha256(balances_chunks_root + length_chunk).digest()
+    
+    balance_leaf = balances_blob[chunk_index * 32:(chunk_index + 1) * 32]
+    return balance_proof, balance_leaf, balances_root
+
+
+def _zeroed_header_root(state: BeaconState) -> bytes:
+    """Root of the latest block header with state_root zeroed, as merkleized into the state."""
+    return state.latest_block_header.root_with_state_root(ZERO_STATE_ROOT)
+
+
+def _validator_data(validator: Validator, prefix: str = "") -> Dict[str, Any]:
+    """Validator fields for proof output, with each byte field hex-encoded once."""
+    return {
+        "pubkey": prefix + validator.pubkey.hex(),
+        "withdrawal_credentials": prefix + validator.withdrawal_credentials.hex(),
+        "effective_balance": validator.effective_balance,
+        "slashed": validator.slashed,
+        "activation_eligibility_epoch": validator.activation_eligibility_epoch,
+        "activation_epoch": validator.activation_epoch,
+        "exit_epoch": validator.exit_epoch,
+        "withdrawable_epoch": validator.withdrawable_epoch
+    }
+
+
+def _header_data(header: BeaconBlockHeader, prefix: str = "",
+                 state_root: Optional[bytes] = None) -> Dict[str, Any]:
+    """
+    Block header fields for proof output, with each root hex-encoded once.
+    
+    state_root, when given, is reported in place of the header's own.
+    """
+    if state_root is None:
+        state_root = header.state_root
+    return {
+        "slot": header.slot,
+        "proposer_index": header.proposer_index,
+        "parent_root": prefix + header.parent_root.hex(),
+        "state_root": prefix + state_root.hex(),
+        "body_root": prefix + header.body_root.hex()
+    }
+
+
 def generate_validator_proof(state_file: str, validator_index: int, 
                            prev_state_root: Optional[str] = None, 
                            prev_block_root: Optional[str] = None) -> ProofResult:
     """Generate a Merkle proof for a validator."""
     state = load_and_process_state(state_file)
-    
+    return generate_validator_proof_from_state(state, validator_index, prev_state_root, prev_block_root)
+
+
+def generate_validator_proof_from_state(state: BeaconState, validator_index: int,
+                                        prev_state_root: Optional[str] = None,
+                                        prev_block_root: Optional[str] = None) -> ProofResult:
+    """Generate a Merkle proof for a validator from an already loaded state."""
     # Convert string parameters to bytes if provided
     prev_state_root_bytes = None
     prev_block_root_bytes = None
     
     if prev_state_root is not None:
-        prev_state_root_bytes = bytes.fromhex(prev_state_root.replace('0x', ''))
+        prev_state_root_bytes = hex_to_bytes(prev_state_root)
     if prev_block_root is not None:
-        prev_block_root_bytes = bytes.fromhex(prev_block_root.replace('0x', ''))
+        prev_block_root_bytes = hex_to_bytes(prev_block_root)
     
     # Use existing values from calculated position if not provided (fallback for compatibility)
     if prev_state_root_bytes is None:
@@ -116,39 +263,26 @@ def generate_validator_proof(state_file: str, validator_index: int,
     if validator_index >= len(state.validators):
         raise ValueError(f"Validator index {validator_index} out of range (max: {len(state.validators)-1})")
     
-    # Prepare state for merkleization
-    state.latest_block_header.state_root = int(0).to_bytes(32)
-    
     # Apply historical data modifications (8 slots ago as per spec)
     state.state_roots[state.slot % 8] = prev_state_root_bytes
     state.block_roots[state.slot % 8] = prev_block_root_bytes
     
     # Generate validator proof within the validators list
-    validator_elements = [v.merkle_root() for v in state.validators]
-    val_proof = get_fixed_capacity_proof(
-        validator_elements,
-        validator_index,
-        VALIDATOR_REGISTRY_LIMIT
-    )
+    val_proof, validators_root = _validator_list_proof(state, validator_index)
     
-    # Add length mixing
-    length_chunk = len(validator_elements).to_bytes(32, "little")
-    val_proof.append(length_chunk)
-    
-    # Recompute validators root using the proof (matching working implementation)
-    leaf = validator_elements[validator_index]
-    validators_root = compute_root_from_proof(
-        leaf, validator_index, val_proof
-    )
+    # Build the state tree once for both the field proof and the state root
+    state_tree = _build_state_tree(state, prev_state_root_bytes, prev_block_root_bytes, validators_root,
+                                   header_root=_zeroed_header_root(state))
     
     # Generate state proof for validators field (field index 9)
-    state_proof = _generate_state_proof(state, field_index=9, prev_state_root=prev_state_root_bytes, prev_block_root=prev_block_root_bytes)
+    state_proof = _generate_state_proof(state, field_index=9, state_tree=state_tree)
     
-    # Combine all proofs
-    full_proof = val_proof + state_proof
+    # Combine all proofs in place
+    val_proof.extend(state_proof)
+    full_proof = val_proof
     
     # Compute final state root (matching working approach)
-    state_root = _compute_state_root(state, validators_root)
+    state_root = _compute_state_root(state, state_tree=state_tree)
     
     # Get the validator object
     validator = state.validators[validator_index]
@@ -162,33 +296,18 @@ def generate_validator_proof(state_file: str, validator_index: int,
         balance=state.balances[validator_index]
     )
 
-    state.header.state_root = state_root
-    header_root = state.header.merkle_root()
+    header_root = state.latest_block_header.root_with_state_root(state_root)
     
+    validator_data = _validator_data(validator)
     metadata = {
         "proof_length": len(full_proof),
         "validator_index": validator_index,
-        "validator_pubkey": validator.pubkey.hex(),
+        "validator_pubkey": validator_data["pubkey"],
         "validator_leaf": validator_leaf.hex(),
         "validator_balance_root": validator_balance.merkle_root().hex(),
-        "validator": {
-            "pubkey": validator.pubkey.hex(),
-            "withdrawal_credentials": validator.withdrawal_credentials.hex(),
-            "effective_balance": validator.effective_balance,
-            "slashed": validator.slashed,
-            "activation_eligibility_epoch": validator.activation_eligibility_epoch,
-            "activation_epoch": validator.activation_epoch,
-            "exit_epoch": validator.exit_epoch,
-            "withdrawable_epoch": validator.withdrawable_epoch
-        },
+        "validator": validator_data,
         "header_root": header_root.hex(),
-        "header": {
-            "slot": state.latest_block_header.slot,
-            "proposer_index": state.latest_block_header.proposer_index,
-            "parent_root": state.latest_block_header.parent_root.hex(),
-            "state_root": state.latest_block_header.state_root.hex(),
-            "body_root": state.latest_block_header.body_root.hex()
-        },
+        "header": _header_data(state.latest_block_header, state_root=state_root),
         "timestamp": state.latest_execution_payload_header.timestamp,
         "block_number": state.latest_execution_payload_header.block_number,
         "prev_state_root": prev_state_root_bytes.hex(),
@@ -203,15 +322,21 @@ def generate_balance_proof(state_file: str, validator_index: int,
                          prev_block_root: Optional[str] = None) -> ProofResult:
     """Generate a Merkle proof for a validator balance."""
     state = load_and_process_state(state_file)
-    
+    return generate_balance_proof_from_state(state, validator_index, prev_state_root, prev_block_root)
+
+
+def generate_balance_proof_from_state(state: BeaconState, validator_index: int,
+                                      prev_state_root: Optional[str] = None,
+                                      prev_block_root: Optional[str] = None) -> ProofResult:
+    """Generate a Merkle proof for a validator balance from an already loaded state."""
     # Convert string parameters to bytes if provided
     prev_state_root_bytes = None
     prev_block_root_bytes = None
     
     if prev_state_root is not None:
-        prev_state_root_bytes = bytes.fromhex(prev_state_root.replace('0x', ''))
+        prev_state_root_bytes = hex_to_bytes(prev_state_root)
     if prev_block_root is not None:
-        prev_block_root_bytes = bytes.fromhex(prev_block_root.replace('0x', ''))
+        prev_block_root_bytes = hex_to_bytes(prev_block_root)
     
     # Use existing values from calculated position if not provided (fallback for compatibility)
     if prev_state_root_bytes is None:
@@ -223,50 +348,26 @@ def generate_balance_proof(state_file: str, validator_index: int,
     if validator_index >= len(state.balances):
         raise ValueError(f"Validator index {validator_index} out of range (max: {len(state.balances)-1})")
     
-    # Prepare state for merkleization
-    state.latest_block_header.state_root = int(0).to_bytes(32)
-    
     # Apply historical data modifications (8 slots ago as per spec)
     state.state_roots[state.slot % 8] = prev_state_root_bytes
     state.block_roots[state.slot % 8] = prev_block_root_bytes
     
     # Generate balance proof within the balances list
-    # Balances are packed 4 per chunk (32 bytes / 8 bytes per uint64)
-    from .ssz.merkle.tree import pack_vector_uint64
+    balance_proof, leaf, balances_root = _balance_list_proof(state, validator_index)
     
-    # Pack all balances into chunks
-    balance_chunks = pack_vector_uint64(state.balances, len(state.balances))
-    
-    # The validator's balance is in chunk at index validator_index // 4
-    chunk_index = validator_index // 4
-    
-    # Calculate the limit for balance chunks
-    limit = (VALIDATOR_REGISTRY_LIMIT * 8 + 31) // 32  # Ceiling division for chunks
-    
-    balance_proof = get_fixed_capacity_proof(
-        balance_chunks,
-        chunk_index,
-        limit
-    )
-    
-    # Add length mixing
-    length_chunk = len(state.balances).to_bytes(32, "little")
-    balance_proof.append(length_chunk)
-    
-    # Recompute balances root using the proof (matching working implementation)
-    leaf = balance_chunks[chunk_index]
-    balances_root = compute_root_from_proof(
-        leaf, chunk_index, balance_proof
-    )
+    # Build the state tree once for both the field proof and the state root
+    state_tree = _build_state_tree(state, prev_state_root_bytes, prev_block_root_bytes,
+                                   balances_root=balances_root, header_root=_zeroed_header_root(state))
     
     # Generate state proof for balances field (field index 10)
-    state_proof = _generate_state_proof(state, field_index=10, prev_state_root=prev_state_root_bytes, prev_block_root=prev_block_root_bytes)
+    state_proof = _generate_state_proof(state, field_index=10, state_tree=state_tree)
     
-    # Combine all proofs
-    full_proof = balance_proof + state_proof
+    # Combine all proofs in place
+    balance_proof.extend(state_proof)
+    full_proof = balance_proof
     
     # Compute final state root
-    state_root = _compute_state_root(state)
+    state_root = _compute_state_root(state, state_tree=state_tree)
     
     # Get balance and validator
     balance = state.balances[validator_index]
@@ -278,9 +379,9 @@ def generate_balance_proof(state_file: str, validator_index: int,
         balance=balance
     )
 
-    state.header.state_root = state_root
-    header_root = state.header.merkle_root()
+    header_root = state.latest_block_header.root_with_state_root(state_root)
     
+    validator_data = _validator_data(validator)
     metadata = {
         "proof_length": len(full_proof),
         "validator_index": validator_index,
@@ -289,24 +390,9 @@ def generate_balance_proof(state_file: str, validator_index: int,
         "balances_root": balances_root.hex(),
         "balance_leaf": leaf.hex(),
         "validator_balance_root": validator_balance.merkle_root().hex(),
-        "validator": {
-            "pubkey": validator.pubkey.hex(),
-            "withdrawal_credentials": validator.withdrawal_credentials.hex(),
-            "effective_balance": validator.effective_balance,
-            "slashed": validator.slashed,
-            "activation_eligibility_epoch": validator.activation_eligibility_epoch,
-            "activation_epoch": validator.activation_epoch,
-            "exit_epoch": validator.exit_epoch,
-            "withdrawable_epoch": validator.withdrawable_epoch
-        },
+        "validator": validator_data,
         "header_root": header_root.hex(),
-        "header": {
-            "slot": state.latest_block_header.slot,
-            "proposer_index": state.latest_block_header.proposer_index,
-            "parent_root": state.latest_block_header.parent_root.hex(),
-            "state_root": state.latest_block_header.state_root.hex(),
-            "body_root": state.latest_block_header.body_root.hex()
-        },
+        "header": _header_data(state.latest_block_header, state_root=state_root),
         "timestamp": state.latest_execution_payload_header.timestamp,
         "block_number": state.latest_execution_payload_header.block_number,
         "prev_state_root": prev_state_root_bytes.hex(),
@@ -318,68 +404,39 @@ def generate_balance_proof(state_file: str, validator_index: int,
 def generate_validator_and_balance_proofs(state_file: str, validator_index: int) -> ProofCombinedResult:
     """Generate a Merkle proofs for a validator and balance."""
     state = load_and_process_state(state_file)
-    
-    # Generate balance proof within the balances list
-    # Balances are packed 4 per chunk (32 bytes / 8 bytes per uint64)
-    from .ssz.merkle.tree import pack_vector_uint64
-    
-    # Pack all balances into chunks
-    balance_chunks = pack_vector_uint64(state.balances, len(state.balances))
-    
-    # The validator's balance is in chunk at index validator_index // 4
-    chunk_index = validator_index // 4
-    
-    # Calculate the limit for balance chunks
-    limit = (VALIDATOR_REGISTRY_LIMIT * 8 + 31) // 32  # Ceiling division for chunks
-    
-    balance_proof = get_fixed_capacity_proof(
-        balance_chunks,
-        chunk_index,
-        limit
-    )
-    
-    # Add length mixing
-    length_chunk = len(state.balances).to_bytes(32, "little")
-    balance_proof.append(length_chunk)
-    
-    # Recompute balances root using the proof (matching working implementation)
-    balance_leaf = balance_chunks[chunk_index]
-    balances_root = compute_root_from_proof(
-        balance_leaf, chunk_index, balance_proof
-    )
-    
-    # Generate state proof for balances field (field index 10)
-    state_proof_balance = _generate_state_proof(state, field_index=10)
-    
-    # Combine all proofs
-    full_proof_balance = balance_proof + state_proof_balance
-
-    # Generate validator proof within the validators list
-    validator_elements = [v.merkle_root() for v in state.validators]
-    val_proof = get_fixed_capacity_proof(
-        validator_elements,
-        validator_index,
-        VALIDATOR_REGISTRY_LIMIT
-    )
-    
-    # Add length mixing
-    length_chunk = len(validator_elements).to_bytes(32, "little")
-    val_proof.append(length_chunk)
-    
-    # Recompute validators root using the proof (matching working implementation)
-    validator_leaf = validator_elements[validator_index]
-    validators_root = compute_root_from_proof(
-        validator_leaf, validator_index, val_proof
-    )
-    
-    # Generate state proof for validators field (field index 9)
-    state_proof_validator = _generate_state_proof(state, field_index=9)
-    
-    # Combine all proofs
-    full_proof_validator = val_proof + state_proof_validator
+    return generate_validator_and_balance_proofs_from_state(state, validator_index)
+
+
+def generate_validator_and_balance_proofs_from_state(state: BeaconState, validator_index: int) -> ProofCombinedResult:
+    """Generate a Merkle proofs for a validator and balance from an already loaded state."""
+    # The balance and validator list proofs only read the state. With the
+    # native hashing backend the GIL is released while hashing, so the two
+    # sides run concurrently; otherwise threads would only add overhead.
+    if HAS_NATIVE_HASHTREE:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            balance_side = pool.submit(_balance_list_proof, state, validator_index)
+            validator_side = pool.submit(_validator_list_proof, state, validator_index)
+            balance_proof, balance_leaf, balances_root = balance_side.result()
+            val_proof, validators_root = validator_side.result()
+    else:
+        balance_proof, balance_leaf, balances_root = _balance_list_proof(state, validator_index)
+        val_proof, validators_root = _validator_list_proof(state, validator_index)
+    
+    # Build the state tree once; both field proofs and the root come from it
+    state_tree = _build_state_tree(state, validators_root=validators_root, balances_root=balances_root)
+    
+    # Generate state proofs for balances (field index 10) and validators (field index 9)
+    state_proof_balance = _generate_state_proof(state, field_index=10, state_tree=state_tree)
+    state_proof_validator = _generate_state_proof(state, field_index=9, state_tree=state_tree)
+    
+    # Combine all proofs in place
+    balance_proof.extend(state_proof_balance)
+    val_proof.extend(state_proof_validator)
+    full_proof_balance = balance_proof
+    full_proof_validator = val_proof
     
     # Compute final state root
-    state_root = _compute_state_root(state)
+    state_root = _compute_state_root(state, state_tree=state_tree)
     
     # Get balance and validator
     balance = state.balances[validator_index]
@@ -408,9 +465,8 @@ def generate_validator_and_balance_proofs(state_file: str, validator_index: int)
         "block_number": state.latest_execution_payload_header.block_number
     }
      
-    # Set the state root on the header before calculating header root
-    state.latest_block_header.state_root = state_root
-    header_root = state.latest_block_header.merkle_root()
+    # Root the header with the computed state root, leaving the state as is
+    header_root = state.latest_block_header.root_with_state_root(state_root)
     
     return ProofCombinedResult(
         balance_proof=full_proof_balance,
@@ -420,31 +476,54 @@ def generate_validator_and_balance_proofs(state_file: str, validator_index: int)
         balances_root=balances_root,
         validator_index=validator_index,
         header_root=header_root,
-        header={
-            "slot": state.latest_block_header.slot,
-            "proposer_index": state.latest_block_header.proposer_index,
-            "parent_root": f"0x{state.latest_block_header.parent_root.hex()}",
-            "state_root": f"0x{state_root.hex()}",
-            "body_root": f"0x{state.latest_block_header.body_root.hex()}"
-        },
-        validator_data={
-            "pubkey": f"0x{validator.pubkey.hex()}",
-            "withdrawal_credentials": f"0x{validator.withdrawal_credentials.hex()}",
-            "effective_balance": validator.effective_balance,
-            "slashed": validator.slashed,
-            "activation_eligibility_epoch": validator.activation_eligibility_epoch,
-            "activation_epoch": validator.activation_epoch,
-            "exit_epoch": validator.exit_epoch,
-            "withdrawable_epoch": validator.withdrawable_epoch
-        },
+        header=_header_data(state.latest_block_header, prefix="0x", state_root=state_root),
+        validator_data=_validator_data(validator, prefix="0x"),
         metadata=metadata
     )
 
+def _build_state_tree(
+    state: BeaconState,
+    prev_state_root: bytes = None,
+    prev_block_root: bytes = None,
+    validators_root: Optional[bytes] = None,
+    balances_root: Optional[bytes] = None,
+    header_root: Optional[bytes] = None
+) -> List[List[bytes]]:
+    """
+    Serialize BeaconState and build its field merkle tree.
+    
+    Build this once per request and pass it to _generate_state_proof and
+    _compute_state_root, instead of re-serializing the state for each.
+    
+    Args:
+        state: BeaconState instance
+        prev_state_root: Previous cycle state root
+        prev_block_root: Previous cycle block root
+        validators_root: Precomputed validators list root to use for field 9
+        balances_root: Precomputed balances list root to use for field 10
+        header_root: Latest block header root to use for field 3
+        
+    Returns:
+        State tree as list of levels, with the root at the last level
+    """
+    # Get serialized state fields using the container's serialize method;
+    # precomputed list roots are used as-is rather than merkleized again
+    state_fields = state.serialize(
+        prev_block_root, prev_state_root, is_electra=True,
+        validators_root=validators_root, balances_root=balances_root,
+        header_root=header_root
+    )
+    
+    # The serialize method already returns the properly padded fields
+    return build_merkle_tree(state_fields)
+
+
 def _generate_state_proof(
     state: BeaconState, 
     field_index: int, 
     prev_state_root: bytes = None, 
-    prev_block_root: bytes = None
+    prev_block_root: bytes = None,
+    state_tree: Optional[List[List[bytes]]] = None
 ) -> List[bytes]:
     """
     Generate proof for a field within BeaconState.
@@ -454,39 +533,57 @@ def _generate_state_proof(
         field_index: Index of the field to prove (9 for validators, 10 for balances)
         prev_state_root: Previous cycle state root
         prev_block_root: Previous cycle block root
+        state_tree: Tree from _build_state_tree; built on demand if None
         
     Returns:
         List of proof steps for the state field
     """
-    # Get serialized state fields using the container's serialize method
-    # Note: We assume this is not Electra for now
-    state_fields = state.serialize(prev_block_root, prev_state_root, is_electra=True)
-    
-    # The serialize method already returns the properly padded fields
-    # Build state tree and get proof
-    state_tree = build_merkle_tree(state_fields)
+    if state_tree is None:
+        state_tree = _build_state_tree(state, prev_state_root, prev_block_root)
     return get_proof(state_tree, field_index)
 
 
-def _compute_state_root(state: BeaconState, validators_root: Optional[bytes] = None) -> bytes:
+def _compute_state_root(
+    state: BeaconState,
+    validators_root: Optional[bytes] = None,
+    state_tree: Optional[List[List[bytes]]] = None
+) -> bytes:
     """Compute the BeaconState merkle root using the state tree approach."""
-    # We need to extract the historical roots that were already set
-    # They should be at index (slot % 8) as per ETH2 spec
-    prev_state_root = state.state_roots[state.slot % 8]
-    prev_block_root = state.block_roots[state.slot % 8]
-    
-    # Use the new serialize method to get all field roots
-    state_fields = state.serialize(prev_block_root, prev_state_root, is_electra=True)
-    
-    # If validators_root is provided, replace field 9 with it
-    if validators_root is not None:
-        state_fields[9] = validators_root
-    
-    # Build the merkle tree and get root
-    state_tree = build_merkle_tree(state_fields)
+    if state_tree is None:
+        # We need to extract the historical roots that were already set
+        # They should be at index (slot % 8) as per ETH2 spec
+        prev_state_root = state.state_roots[state.slot % 8]
+        prev_block_root = state.block_roots[state.slot % 8]
+        state_tree = _build_state_tree(state, prev_state_root, prev_block_root, validators_root)
     return state_tree[-1][0]  # Root is at the top level
 
 
+# (prev_state_root, prev_block_root) defaults, read from state-8.json once
+_STATE_8_FALLBACK: Optional[Tuple[bytes, bytes]] = None
+_state_8_lock = threading.Lock()
+
+
+def _load_state8_once() -> Tuple[bytes, bytes]:
+    """Default historical roots for generate_merkle_witness, loaded on first use."""
+    global _STATE_8_FALLBACK
+    with _state_8_lock:
+        if _STATE_8_FALLBACK is None:
+            try:
+                with open("test/data/state-8.json", "rb") as f:
+                    state_8_data = orjson.loads(f.read())["data"]
+                _STATE_8_FALLBACK = (
+                    hex_to_bytes(state_8_data["state_roots"][2]),
+                    hex_to_bytes(state_8_data["block_roots"][2]),
+                )
+            except FileNotFoundError:
+                # Fallback to hardcoded values if file not found
+                _STATE_8_FALLBACK = (
+                    bytes.fromhex("01ef6767e8908883d1e84e91095bbb3f7d98e33773d13b6cc949355909365ff8"),
+                    bytes.fromhex("28925c02852c6462577e73cc0fdb0f49bbf910b559c8c0d1b8f69cac38fa3f74"),
+                )
+        return _STATE_8_FALLBACK
+
+
 def generate_merkle_witness(
     json_file: str, 
     validator_index: int,
@@ -520,30 +617,19 @@ def generate_merkle_witness(
     prev_block_root_bytes = None
     
     if prev_state_root is not None:
-        prev_state_root_bytes = bytes.fromhex(prev_state_root.replace('0x', ''))
+        prev_state_root_bytes = hex_to_bytes(prev_state_root)
     if prev_block_root is not None:
-        prev_block_root_bytes = bytes.fromhex(prev_block_root.replace('0x', ''))
+        prev_block_root_bytes = hex_to_bytes(prev_block_root)
     
     # Load historical values from state-8.json if not provided
     if prev_state_root_bytes is None or prev_block_root_bytes is None:
-        try:
-            with open("test/data/state-8.json", "r") as f:
-                state_8_data = json.load(f)["data"]
-            if prev_state_root_bytes is None:
-                prev_state_root_hex = state_8_data["state_roots"][2][2:]  # Remove 0x prefix
-                prev_state_root_bytes = bytes.fromhex(prev_state_root_hex)
-            if prev_block_root_bytes is None:
-                prev_block_root_hex = state_8_data["block_roots"][2][2:]  # Remove 0x prefix
-                prev_block_root_bytes = bytes.fromhex(prev_block_root_hex)
-        except FileNotFoundError:
-            # Fallback to hardcoded values if file not found
-            if prev_state_root_bytes is None:
-                prev_state_root_bytes = bytes.fromhex("01ef6767e8908883d1e84e91095bbb3f7d98e33773d13b6cc949355909365ff8")
-            if prev_block_root_bytes is None:
-                prev_block_root_bytes = bytes.fromhex("28925c02852c6462577e73cc0fdb0f49bbf910b559c8c0d1b8f69cac38fa3f74")
+        fallback_state_root, fallback_block_root = _load_state8_once()
+        if prev_state_root_bytes is None:
+            prev_state_root_bytes = fallback_state_root
+        if prev_block_root_bytes is None:
+            prev_block_root_bytes = fallback_block_root
     
     # Set the state root from 8 slots ago (required by Beacon Chain spec)
-    state.latest_block_header.state_root = int(0).to_bytes(32)
     state.state_roots[state.slot % 8] = prev_state_root_bytes
     state.block_roots[state.slot % 8] = prev_block_root_bytes
     
@@ -551,25 +637,27 @@ def generate_merkle_witness(
     print(f"Using prev_block_root (8 slots ago): {prev_block_root_bytes.hex()}")
     
     # Generate the proof
-    proof = []
     current_index = validator_index
     
     # Step 1: Get proof of validator within validators list
-    validator_tree = merkle_list_tree([v.merkle_root() for v in state.validators])
-    validator_proof = get_fixed_capacity_proof(validator_tree, current_index, VALIDATOR_REGISTRY_LIMIT)
-    proof.extend(validator_proof)
+    # (same siblings as get_fixed_capacity_proof, read from the cached tree)
+    proof, _ = _list_proof_and_root(
+        "validators", batch_validator_roots(state.validators), current_index, VALIDATOR_REGISTRY_LIMIT
+    )
     
     # Step 2: Get proof that validators list is in state
+    state_tree = _build_state_tree(
+        state, prev_state_root_bytes, prev_block_root_bytes, header_root=_zeroed_header_root(state)
+    )
     state_proof = _generate_state_proof(
         state, 
         9,  # Field index for validators
-        prev_state_root_bytes,
-        prev_block_root_bytes
+        state_tree=state_tree
     )
     proof.extend(state_proof)
     
     # Compute final state root
-    state_root = _compute_state_root(state)
+    state_root = _compute_state_root(state, state_tree=state_tree)
     
     return proof, state_root
 
@@ -5,11 +5,20 @@ This module defines Pydantic models for API request and response validation.
 These models ensure proper data structure and type validation for the proof API.
 """
 
-from typing import List, Optional
-from pydantic import BaseModel, Field, validator
+import re
+from typing import Annotated, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
 from datetime import datetime
 
 
+# Hex string with 0x prefix, checked by pydantic-core's compiled regex
+HexStr = Annotated[str, StringConstraints(pattern=r"^0x[0-9a-fA-F]*$")]
+
+# 0x-prefixed 48-byte pubkeys and 32-byte roots
+_PUBKEY_RE = re.compile(r"0x[0-9a-fA-F]{96}")
+_HASH32_RE = re.compile(r"0x[0-9a-fA-F]{64}")
+
+
 class ErrorResponse(BaseModel):
     """
     Response model for API errors.
@@ -55,14 +64,15 @@ class CombinedProofRequest(BaseModel):
     prev_state_root: Optional[str] = Field(default=None, description="Previous state root from 8 slots ago (hex string)")
     prev_block_root: Optional[str] = Field(default=None, description="Previous block root from 8 slots ago (hex string)")
     
-    @validator('identifier')
+    @field_validator('identifier')
+    @classmethod
     def validate_identifier(cls, v):
         """Validate identifier is either a number or hex pubkey."""
         if not v:
             raise ValueError("Identifier cannot be empty")
         # Check if it's a pubkey (hex string)
         if v.startswith('0x'):
-            if len(v) != 98:  # 0x + 96 hex chars
+            if not _PUBKEY_RE.fullmatch(v):
                 raise ValueError("Pubkey must be 48 bytes (96 hex chars) with 0x prefix")
         else:
             # Must be a number
@@ -72,24 +82,27 @@ class CombinedProofRequest(BaseModel):
                 raise ValueError("Identifier must be a number or hex pubkey starting with 0x")
         return v
     
-    @validator('slot')
+    @field_validator('slot')
+    @classmethod
     def validate_slot(cls, v):
         """Validate slot parameter."""
         if v not in ["head", "finalized", "recent"] and not v.isdigit():
             raise ValueError("Slot must be 'head', 'finalized', 'recent', or a valid number")
         return v
     
-    @validator('prev_state_root')
+    @field_validator('prev_state_root')
+    @classmethod
     def validate_prev_state_root(cls, v):
         """Validate prev_state_root is proper hex string if provided."""
-        if v is not None and (not v.startswith('0x') or len(v) != 66):
+        if v is not None and not _HASH32_RE.fullmatch(v):
             raise ValueError("prev_state_root must be a 32-byte hex string starting with '0x'")
         return v
     
-    @validator('prev_block_root')
+    @field_validator('prev_block_root')
+    @classmethod
     def validate_prev_block_root(cls, v):
         """Validate prev_block_root is proper hex string if provided."""
-        if v is not None and (not v.startswith('0x') or len(v) != 66):
+        if v is not None and not _HASH32_RE.fullmatch(v):
             raise ValueError("prev_block_root must be a 32-byte hex string starting with '0x'")
         return v
 
@@ -99,6 +112,11 @@ class CombinedProofResponse(BaseModel):
     Response model for combined validator and balance proofs.
     Matches the ProofCombinedResult from main.py for consistency.
     
+    Only CombinedProofRequest is validated, since it carries untrusted API
+    input. Responses are built from proof data the service just produced,
+    so they are serialized without validation (or via model_construct);
+    this model documents the response schema.
+    
     Attributes:
         balance_proof: List of balance proof steps as hex strings
         validator_proof: List of validator proof steps as hex strings
@@ -111,34 +129,19 @@ class CombinedProofResponse(BaseModel):
         validator_data: Validator data
         metadata: Additional metadata including timestamp
     """
-    balance_proof: List[str] = Field(..., description="List of balance proof steps as hex strings")
-    validator_proof: List[str] = Field(..., description="List of validator proof steps as hex strings")
-    state_root: str = Field(..., description="State root as hex string")
-    balance_leaf: str = Field(..., description="Balance leaf value as hex string")
-    balances_root: str = Field(..., description="Balances merkle root as hex string")
+    balance_proof: List[HexStr] = Field(..., description="List of balance proof steps as hex strings")
+    validator_proof: List[HexStr] = Field(..., description="List of validator proof steps as hex strings")
+    state_root: HexStr = Field(..., description="State root as hex string")
+    balance_leaf: HexStr = Field(..., description="Balance leaf value as hex string")
+    balances_root: HexStr = Field(..., description="Balances merkle root as hex string")
     validator_index: int = Field(..., description="Validator index")
-    header_root: str = Field(..., description="Block header root as hex string")
+    header_root: HexStr = Field(..., description="Block header root as hex string")
     header: dict = Field(..., description="Block header information")
     validator_data: dict = Field(..., description="Validator data")
     metadata: dict = Field(default_factory=dict, description="Additional proof metadata")
     
-    @validator('balance_proof', 'validator_proof')
-    def validate_proof_format(cls, v):
-        """Validate proof steps are proper hex strings."""
-        for step in v:
-            if not isinstance(step, str) or not step.startswith('0x'):
-                raise ValueError("All proof steps must be hex strings starting with '0x'")
-        return v
-    
-    @validator('state_root', 'balance_leaf', 'balances_root', 'header_root')
-    def validate_hex_format(cls, v):
-        """Validate hex string format."""
-        if not v.startswith('0x'):
-            raise ValueError("Must be a hex string starting with '0x'")
-        return v
-    
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "balance_proof": ["0x1234...", "0x5678..."],
                 "validator_proof": ["0xabcd...", "0xef01..."],
@@ -175,4 +178,5 @@ class CombinedProofResponse(BaseModel):
                     "effective_balance": "5930000000000000"
                 }
             }
-        } 
\ No newline at end of file
+        } 
+    )
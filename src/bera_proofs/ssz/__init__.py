@@ -47,12 +47,17 @@ __all__ = [
     'BYTES_PER_CHUNK',
     'SLOTS_PER_HISTORICAL_ROOT', 
     'VALIDATOR_REGISTRY_LIMIT',
+    'VALIDATOR_TREE_DEPTH',
+    'BALANCE_CHUNK_LIMIT',
+    'BALANCE_TREE_DEPTH',
     'EPOCHS_PER_HISTORICAL_VECTOR',
     'EPOCHS_PER_SLASHINGS_VECTOR',
     
     # Core serialization
     'serialize_uint64',
+    'serialize_uint64_array',
     'serialize_bytes', 
+    'serialize_bytes_unchecked',
     'serialize_list',
     'serialize_vector',
     'serialize_container',
@@ -84,13 +89,16 @@ __all__ = [
     'merkleize_chunks',
     'merkle_root_from_chunks',
     'merkle_root_list_fixed',
+    'pack_uint64_bytes',
     'pack_vector_uint64',
     'pack_vector_bytes32',
     'get_tree_depth',
     'validate_tree_structure',
+    'IncrementalMerkleTree',
     
     # Proof functions
     'get_fixed_capacity_proof',
+    'get_fixed_capacity_proof_and_root',
     'compute_root_from_proof',
     'verify_merkle_proof',
     'get_proof',
@@ -104,6 +112,7 @@ __all__ = [
     'Validator',
     'ValidatorBalance',
     'BeaconState',
+    'batch_validator_roots',
     
     # Container utilities
     'json_to_class',
@@ -111,6 +120,7 @@ __all__ = [
     
     # Utility functions
     'bytes_to_hex',
+    'bytes_list_to_hex',
     'hex_to_bytes',
     'validate_hex_string',
     'ensure_bytes',
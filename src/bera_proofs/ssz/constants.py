@@ -46,6 +46,15 @@ MAX_VALIDATORS = 1000000  # Set high enough to not limit beacon state processing
 # Production limit from the Ethereum specification
 VALIDATOR_REGISTRY_LIMIT = 1099511627776
 
+# Depth of the validators list tree (2^40 leaves)
+VALIDATOR_TREE_DEPTH = 40
+
+# Chunk capacity of the balances list: uint64 balances packed 4 per 32-byte chunk
+BALANCE_CHUNK_LIMIT = (VALIDATOR_REGISTRY_LIMIT * 8 + 31) // 32
+
+# Depth of the balances list tree (2^38 chunks)
+BALANCE_TREE_DEPTH = (BALANCE_CHUNK_LIMIT - 1).bit_length()
+
 # Maximum pending partial withdrawals (Electra)
 PENDING_PARTIAL_WITHDRAWALS_LIMIT = 134217728  # 2^27
 
@@ -64,7 +73,7 @@ BYTES_PER_LOGS_BLOOM = 256
 # These are used to efficiently pad Merkle trees without recomputing zero hashes
 # Each level i contains: SHA256(ZERO_HASHES[i-1] || ZERO_HASHES[i-1])
 ZERO_HASHES = [b"\0" * 32]
-for _ in range(40):
+for _ in range(VALIDATOR_TREE_DEPTH):
     ZERO_HASHES.append(sha256(ZERO_HASHES[-1] + ZERO_HASHES[-1]).digest())
 
 # ====================
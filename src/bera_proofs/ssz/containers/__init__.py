@@ -23,9 +23,10 @@ from .beacon import (
     Validator,
     ValidatorBalance,
     BeaconState,
-    PendingPartialWithdrawal
+    PendingPartialWithdrawal,
+    batch_validator_roots,
 )
-from .utils import json_to_class, load_and_process_state
+from .utils import json_to_class, load_and_process_state, process_state_dict
 
 __all__ = [
     # Base classes
@@ -40,8 +41,10 @@ __all__ = [
     'ValidatorBalance',
     'BeaconState',
     'PendingPartialWithdrawal',
+    'batch_validator_roots',
     
     # Utilities
     'json_to_class',
-    'load_and_process_state'
+    'load_and_process_state',
+    'process_state_dict'
 ] 
\ No newline at end of file
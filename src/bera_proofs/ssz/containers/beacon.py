@@ -4,8 +4,13 @@ Beacon Chain Data Structures
 This module contains SSZ container definitions for Ethereum Beacon Chain data structures.
 """
 
-from dataclasses import dataclass
-from typing import List, Tuple
+import struct
+import threading
+from dataclasses import dataclass, field
+from functools import cached_property
+from hashlib import sha256
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
 
 from ..constants import (
     SLOTS_PER_HISTORICAL_ROOT,
@@ -14,7 +19,16 @@ from ..constants import (
     EPOCHS_PER_SLASHINGS_VECTOR,
     BERACHAIN_VECTOR,
     PENDING_PARTIAL_WITHDRAWALS_LIMIT,
+    ZERO_HASHES,
 )
+from ..merkle._hashtree import HAS_NATIVE_HASHTREE, hash_pairs
+
+# Number of validator roots kept across states; unchanged validators between
+# slots hit the cache instead of being rehashed
+VALIDATOR_ROOT_CACHE_SIZE = 2**16
+
+# Smallest number of uncached validators worth hashing with the native backend
+NATIVE_BATCH_MIN_VALIDATORS = 1024
 
 
 @dataclass
@@ -59,6 +73,8 @@ class BeaconBlockHeader:
     parent_root: bytes
     state_root: bytes
     body_root: bytes
+    # (fields other than state_root, hash(slot, proposer_index), body_root subtree)
+    _prefix_cache: Optional[Tuple] = field(default=None, init=False, repr=False, compare=False)
 
     def serialize(self) -> List[bytes]:
         """Serialize BeaconBlockHeader fields to list of 32-byte chunks."""
@@ -81,7 +97,29 @@ class BeaconBlockHeader:
 
     def merkle_root(self) -> bytes:
         """Calculate SSZ merkle root for BeaconBlockHeader."""
-        return self.merkle_tree()[-1][0]
+        return self.root_with_state_root(self.state_root)
+
+    def root_with_state_root(self, state_root: bytes) -> bytes:
+        """
+        Merkle root this header would have with the given state_root.
+        
+        Proof generation roots the header once with a zeroed state_root and
+        once with the computed one, without modifying the header. The
+        subtrees that do not contain state_root are cached and reused for as
+        long as slot, proposer_index, parent_root and body_root are unchanged.
+        """
+        key = (self.slot, self.proposer_index, self.parent_root, self.body_root)
+        cached = self._prefix_cache
+        if cached is None or cached[0] != key:
+            tree = self.merkle_tree()
+            cached = self._prefix_cache = (key, tree[1][0], tree[2][1])
+            if state_root == self.state_root:
+                return tree[-1][0]
+        _, slot_proposer_root, body_subtree_root = cached
+        parent_state_root = sha256(self.parent_root + state_root).digest()
+        return sha256(
+            sha256(slot_proposer_root + parent_state_root).digest() + body_subtree_root
+        ).digest()
 
     def get_proof(self, index: int) -> List[bytes]:
         """Get merkle proof for field at index."""
@@ -218,8 +256,17 @@ class Validator:
         return build_merkle_tree(self.serialize())
 
     def merkle_root(self) -> bytes:
-        """Calculate SSZ merkle root for Validator."""
-        return self.merkle_tree()[-1][0]
+        """Calculate SSZ merkle root for Validator (cached by field values)."""
+        return _cached_validator_root((
+            self.pubkey,
+            self.withdrawal_credentials,
+            self.effective_balance,
+            self.slashed,
+            self.activation_eligibility_epoch,
+            self.activation_epoch,
+            self.exit_epoch,
+            self.withdrawable_epoch,
+        ))
 
     def get_proof(self, index: int) -> List[bytes]:
         """Get merkle proof for field at index."""
@@ -227,6 +274,143 @@ class Validator:
         return get_proof(self.merkle_tree(), index)
 
 
+# Validator leaves 2-7 (effective_balance, slashed and the four epochs) packed
+# as the three 64-byte sibling pairs hashed at the first tree level
+_VALIDATOR_UINT_PAIRS = struct.Struct("<Q24xB31xQ24xQ24xQ24xQ24x")
+_PUBKEY_PADDING = b"\0" * 16
+# A uint64 as a 32-byte merkle leaf
+_UINT64_LEAF = struct.Struct("<Q24x")
+
+# Validator roots keyed by field values; oldest entries are evicted first.
+# Proofs run on worker threads, so every access holds the lock.
+_validator_root_cache: Dict[Tuple, bytes] = {}
+_validator_root_cache_lock = threading.Lock()
+
+
+def _validator_root(fields: Tuple) -> bytes:
+    """
+    Compute the merkle root of a Validator from its field values.
+    
+    Equivalent to Validator(*fields).merkle_tree()[-1][0], but packs the
+    eight leaves directly and hashes the three tree levels inline instead of
+    going through merkle_root_basic and build_merkle_tree.
+    """
+    (pubkey, withdrawal_credentials, effective_balance, slashed,
+     activation_eligibility_epoch, activation_epoch, exit_epoch, withdrawable_epoch) = fields
+    if len(pubkey) != 48 or len(withdrawal_credentials) != 32:
+        return Validator(*fields).merkle_tree()[-1][0]
+    packed = _VALIDATOR_UINT_PAIRS.pack(
+        effective_balance, 1 if slashed else 0,
+        activation_eligibility_epoch, activation_epoch, exit_epoch, withdrawable_epoch,
+    )
+    pubkey_root = sha256(pubkey + _PUBKEY_PADDING).digest()
+    left = sha256(
+        sha256(pubkey_root + withdrawal_credentials).digest()
+        + sha256(packed[:64]).digest()
+    ).digest()
+    right = sha256(
+        sha256(packed[64:128]).digest() + sha256(packed[128:]).digest()
+    ).digest()
+    return sha256(left + right).digest()
+
+
+def _native_validator_roots(keys: List[Tuple]) -> List[bytes]:
+    """
+    Compute many validator roots level by level with the native hasher.
+    
+    Each tree level of every validator is hashed in one hash_pairs call,
+    which libhashtree spreads across threads with the GIL released. The
+    digests of one level are laid out so that they already form the
+    64-byte blocks of the next.
+    """
+    pack = _VALIDATOR_UINT_PAIRS.pack
+    pubkey_roots = hash_pairs(b"".join([k[0] + _PUBKEY_PADDING for k in keys]))
+    level = b"".join([
+        pubkey_roots[i * 32:i * 32 + 32] + k[1]
+        + pack(k[2], 1 if k[3] else 0, k[4], k[5], k[6], k[7])
+        for i, k in enumerate(keys)
+    ])
+    # 4 -> 2 -> 1 nodes per validator
+    for _ in range(3):
+        level = hash_pairs(level)
+    return [level[i:i + 32] for i in range(0, len(level), 32)]
+
+
+def _trim_validator_root_cache() -> None:
+    """
+    Evict the oldest cached validator roots beyond VALIDATOR_ROOT_CACHE_SIZE.
+    
+    The caller must hold _validator_root_cache_lock.
+    """
+    excess = len(_validator_root_cache) - VALIDATOR_ROOT_CACHE_SIZE
+    if excess > 0:
+        for key in list(islice(_validator_root_cache, excess)):
+            _validator_root_cache.pop(key, None)
+
+
+def _cached_validator_root(fields: Tuple) -> bytes:
+    """Merkle root of a Validator from its field values, via the root cache."""
+    with _validator_root_cache_lock:
+        root = _validator_root_cache.get(fields)
+    if root is None:
+        root = _validator_root(fields)
+        with _validator_root_cache_lock:
+            _validator_root_cache[fields] = root
+            _trim_validator_root_cache()
+    return root
+
+
+def batch_validator_roots(validators: List[Validator]) -> List[bytes]:
+    """
+    Compute the merkle roots of many validators in one pass.
+    
+    Cached roots are looked up first; the misses are hashed together, with
+    the native backend in parallel when it is available and the batch is
+    large enough to benefit.
+    
+    Args:
+        validators: Validators to merkleize
+        
+    Returns:
+        List of 32-byte validator roots, in input order
+    """
+    keys = [
+        (
+            v.pubkey,
+            v.withdrawal_credentials,
+            v.effective_balance,
+            v.slashed,
+            v.activation_eligibility_epoch,
+            v.activation_epoch,
+            v.exit_epoch,
+            v.withdrawable_epoch,
+        )
+        for v in validators
+    ]
+    cache = _validator_root_cache
+    with _validator_root_cache_lock:
+        roots = [cache.get(key) for key in keys]
+    missing = [i for i, root in enumerate(roots) if root is None]
+    if not missing:
+        return roots
+    
+    missing_keys = [keys[i] for i in missing]
+    if (
+        HAS_NATIVE_HASHTREE
+        and len(missing_keys) >= NATIVE_BATCH_MIN_VALIDATORS
+        and all(len(k[0]) == 48 and len(k[1]) == 32 for k in missing_keys)
+    ):
+        new_roots = _native_validator_roots(missing_keys)
+    else:
+        new_roots = [_validator_root(key) for key in missing_keys]
+    
+    with _validator_root_cache_lock:
+        for i, key, root in zip(missing, missing_keys, new_roots):
+            roots[i] = cache[key] = root
+        _trim_validator_root_cache()
+    return roots
+
+
 @dataclass
 class ValidatorBalance:
     """ValidatorBalance combines a validator with their balance."""
@@ -250,8 +434,16 @@ class ValidatorBalance:
         return build_merkle_tree(self.serialize())
     
     def merkle_root(self) -> bytes:
-        """Calculate SSZ merkle root for ValidatorBalance."""
-        return self.merkle_tree()[-1][0]
+        """
+        Calculate SSZ merkle root for ValidatorBalance.
+        
+        Equivalent to merkle_tree()[-1][0]: the two padding leaves always
+        hash to ZERO_HASHES[1], so only two hashes are needed.
+        """
+        balance_leaf = _UINT64_LEAF.pack(self.balance)
+        return sha256(
+            sha256(self.validator.merkle_root() + balance_leaf).digest() + ZERO_HASHES[1]
+        ).digest()
     
     def get_proof(self, index: int) -> List[bytes]:
         """Get merkle proof for field at index."""
@@ -319,8 +511,30 @@ class BeaconState:
         if self.pending_partial_withdrawals is None:
             self.pending_partial_withdrawals = []
 
-    def serialize(self, prev_cycle_block_root: bytes = None, prev_cycle_state_root: bytes = None, is_electra: bool = False) -> List[bytes]:
-        """Serialize BeaconState fields to list of 32-byte chunks."""
+    @cached_property
+    def packed_balances(self) -> bytes:
+        """
+        Balances SSZ-packed into one blob of 32-byte chunks.
+        
+        Computed on first access and kept for the lifetime of the state;
+        chunk i is packed_balances[32 * i:32 * (i + 1)].
+        """
+        from ..merkle.tree import pack_uint64_bytes
+        return pack_uint64_bytes(self.balances)
+
+    def serialize(self, prev_cycle_block_root: bytes = None, prev_cycle_state_root: bytes = None, is_electra: bool = False,
+                  validators_root: Optional[bytes] = None, balances_root: Optional[bytes] = None,
+                  header_root: Optional[bytes] = None) -> List[bytes]:
+        """
+        Serialize BeaconState fields to list of 32-byte chunks.
+        
+        validators_root and balances_root, when given, are used as the
+        validators and balances field roots instead of merkleizing those
+        lists again (proof generation already has them from its list trees).
+        header_root likewise replaces the latest_block_header root, so a
+        header root with a zeroed state_root can be used without writing it
+        into the header.
+        """
         from ..merkle.core import merkle_root_basic
         from ..merkle.encoding import (
             encode_validators_leaf_list,
@@ -344,15 +558,21 @@ class BeaconState:
             self.state_roots[self.slot % BERACHAIN_VECTOR] = prev_cycle_state_root
             self.block_roots[self.slot % BERACHAIN_VECTOR] = prev_cycle_block_root
 
-        roots.append(self.latest_block_header.merkle_root())      
+        if header_root is None:
+            header_root = self.latest_block_header.merkle_root()
+        roots.append(header_root)
         
         roots.append(encode_block_roots(self.block_roots))
         roots.append(encode_block_roots(self.state_roots))
         roots.append(self.eth1_data.merkle_root())
         roots.append(merkle_root_basic(self.eth1_deposit_index, "uint64"))
         roots.append(self.latest_execution_payload_header.merkle_root())
-        roots.append(encode_validators_leaf_list([v.merkle_root() for v in self.validators]))
-        roots.append(encode_balances(self.balances))
+        if validators_root is None:
+            validators_root = encode_validators_leaf_list(batch_validator_roots(self.validators))
+        roots.append(validators_root)
+        if balances_root is None:
+            balances_root = encode_balances(self.balances)
+        roots.append(balances_root)
         roots.append(encode_randao_mixes(self.randao_mixes))
         roots.append(merkle_root_basic(self.next_withdrawal_index, "uint64"))
         roots.append(merkle_root_basic(self.next_withdrawal_validator_index, "uint64"))
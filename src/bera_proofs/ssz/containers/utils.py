@@ -5,24 +5,43 @@ This module provides utility functions for working with SSZ containers,
 including JSON conversion and data loading functions.
 """
 
-from typing import Any, Dict, List, Union, Type, TYPE_CHECKING
-import json
+from dataclasses import replace
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, List, Union, Type
+import mmap
 import re
+import threading
 
-if TYPE_CHECKING:
-    from .beacon import BeaconState
+import orjson
 
+from .beacon import (
+    Fork,
+    BeaconBlockHeader,
+    Eth1Data,
+    ExecutionPayloadHeader,
+    Validator,
+    BeaconState,
+    PendingPartialWithdrawal,
+)
 
+
+_HEX_RE = re.compile(r"[0-9a-fA-F]*")
+_CAMEL_RE1 = re.compile("(.)([A-Z][a-z]+)")
+_CAMEL_RE2 = re.compile("([a-z0-9])([A-Z])")
+
+
+@lru_cache(maxsize=512)
 def camel_to_snake(name: str) -> str:
-    name = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", name).lower()
+    name = _CAMEL_RE1.sub(r"\1_\2", name)
+    return _CAMEL_RE2.sub(r"\1_\2", name).lower()
 
 
 def normalize_hex(hex_str, expected_bytes=None):
     if not isinstance(hex_str, str) or not hex_str.startswith("0x"):
         return hex_str
     hex_part = hex_str[2:]
-    if not all(c in "0123456789abcdefABCDEF" for c in hex_part):
+    if not _HEX_RE.fullmatch(hex_part):
         raise ValueError(f"Invalid hex string: {hex_str}")
     # Pad to even length
     if len(hex_part) % 2 == 1:
@@ -30,9 +49,103 @@ def normalize_hex(hex_str, expected_bytes=None):
     return "0x" + hex_part
 
 
-def json_to_class(data: Any, cls: type) -> Any:
-    from .beacon import Fork, BeaconBlockHeader, Eth1Data, ExecutionPayloadHeader, Validator, BeaconState, PendingPartialWithdrawal
+# Maximum number of Validator instances kept for reuse across state loads
+VALIDATOR_CACHE_SIZE = 2**16
+
+# States may be loaded on worker threads, so every access holds the lock
+_validator_cache: Dict[tuple, Any] = {}
+_validator_cache_lock = threading.Lock()
+
+# Fields whose 0x-prefixed JSON values are raw bytes
+_HEX_FIELDS = frozenset({
+    "pubkey",
+    "withdrawal_credentials",
+    "genesis_validators_root",
+    "parent_root",
+    "state_root",
+    "body_root",
+    "deposit_root",
+    "block_hash",
+    "parent_hash",
+    "fee_recipient",
+    "receipts_root",
+    "logs_bloom",
+    "prev_randao",
+    "transactions_root",
+    "withdrawals_root",
+    "extra_data",
+    "previous_version",
+    "current_version",
+})
+
+# Fields whose 0x-prefixed JSON values are hex-encoded integers
+_INT_FIELDS = frozenset({
+    "slot",
+    "effective_balance",
+    "activation_eligibility_epoch",
+    "activation_epoch",
+    "exit_epoch",
+    "withdrawable_epoch",
+    "proposer_index",
+    "epoch",
+    "deposit_count",
+    "block_number",
+    "gas_limit",
+    "gas_used",
+    "timestamp",
+    "blob_gas_used",
+    "excess_blob_gas",
+    "next_withdrawal_validator_index",
+    "validator_index",
+    "amount",
+})
+
+
+def _hexlist_to_chunks(hexes: List[str]) -> List[bytes]:
+    """Decode a list of 0x-prefixed bytes32 hex strings with a single fromhex call."""
+    if not all(len(h) == 66 for h in hexes):
+        # Not every entry is a bytes32; decode them one by one so each keeps
+        # its own length and odd-length entries fail as they would alone
+        return [bytes.fromhex(h[2:]) for h in hexes]
+    joined = bytes.fromhex("".join(h[2:] for h in hexes))
+    return [joined[i:i + 32] for i in range(0, len(joined), 32)]
+
+
+def _trim_validator_cache() -> None:
+    """
+    Evict the oldest cached validators beyond VALIDATOR_CACHE_SIZE.
     
+    The caller must hold _validator_cache_lock.
+    """
+    excess = len(_validator_cache) - VALIDATOR_CACHE_SIZE
+    if excess > 0:
+        for key in list(islice(_validator_cache, excess)):
+            _validator_cache.pop(key, None)
+
+
+def _validator_from_json(data: Any) -> Any:
+    """
+    Convert a validator JSON dict, decoding each distinct dict only once.
+    
+    Consecutive states repeat almost every validator unchanged, so the key is
+    the full raw dict; any field change produces a new entry. Validators are
+    mutable, so every call returns its own copy of the cached instance and
+    no two states share one.
+    """
+    if not isinstance(data, dict):
+        return data
+    key = tuple(data.items())
+    with _validator_cache_lock:
+        validator = _validator_cache.get(key)
+    if validator is None:
+        validator = json_to_class(data, Validator)
+        with _validator_cache_lock:
+            _validator_cache[key] = validator
+            _trim_validator_cache()
+    return replace(validator)
+
+
+def json_to_class(data: Any, cls: type) -> Any:
     if isinstance(data, dict):
         # Convert keys to snake_case and adjust data types
         processed = {}
@@ -42,47 +155,9 @@ def json_to_class(data: Any, cls: type) -> Any:
                 new_key = "parent_root"
             if isinstance(value, str) and value.startswith("0x"):
                 value = normalize_hex(value)
-                if new_key in {
-                    "pubkey",
-                    "withdrawal_credentials",
-                    "genesis_validators_root",
-                    "parent_root",
-                    "state_root",
-                    "body_root",
-                    "deposit_root",
-                    "block_hash",
-                    "parent_hash",
-                    "fee_recipient",
-                    "receipts_root",
-                    "logs_bloom",
-                    "prev_randao",
-                    "transactions_root",
-                    "withdrawals_root",
-                    "extra_data",
-                    "previous_version",
-                    "current_version",
-                }:
+                if new_key in _HEX_FIELDS:
                     processed[new_key] = bytes.fromhex(value[2:])
-                elif new_key in {
-                    "slot",
-                    "effective_balance",
-                    "activation_eligibility_epoch",
-                    "activation_epoch",
-                    "exit_epoch",
-                    "withdrawable_epoch",
-                    "proposer_index",
-                    "epoch",
-                    "deposit_count",
-                    "block_number",
-                    "gas_limit",
-                    "gas_used",
-                    "timestamp",
-                    "blob_gas_used",
-                    "excess_blob_gas",
-                    "next_withdrawal_validator_index",
-                    "validator_index",
-                    "amount",
-                }:
+                elif new_key in _INT_FIELDS:
                     processed[new_key] = (
                         int(value, 16) if isinstance(value, str) else value
                     )
@@ -91,19 +166,7 @@ def json_to_class(data: Any, cls: type) -> Any:
             else:
                 processed[new_key] = value
 
-        if cls == Fork:
-            return Fork(**processed)
-        elif cls == BeaconBlockHeader:
-            return BeaconBlockHeader(**processed)
-        elif cls == Eth1Data:
-            return Eth1Data(**processed)
-        elif cls == ExecutionPayloadHeader:
-            return ExecutionPayloadHeader(**processed)
-        elif cls == Validator:
-            return Validator(**processed)
-        elif cls == PendingPartialWithdrawal:
-            return PendingPartialWithdrawal(**processed)
-        if cls == BeaconState:
+        if cls is BeaconState:
             # Provide default values for missing fields
             processed["next_withdrawal_index"] = processed.get(
                 "next_withdrawal_index", 0
@@ -124,30 +187,58 @@ def json_to_class(data: Any, cls: type) -> Any:
                 processed["latest_execution_payload_header"], ExecutionPayloadHeader
             )
             processed["validators"] = [
-                json_to_class(v, Validator) for v in processed["validators"]
+                _validator_from_json(v) for v in processed["validators"]
             ]
             processed["pending_partial_withdrawals"] = [
                 json_to_class(w, PendingPartialWithdrawal) for w in processed.get("pending_partial_withdrawals", [])
             ]
-            processed["block_roots"] = [
-                bytes.fromhex(br[2:]) for br in processed["block_roots"]
-            ]
-            processed["state_roots"] = [
-                bytes.fromhex(sr[2:]) for sr in processed["state_roots"]
-            ]
-            processed["randao_mixes"] = [
-                bytes.fromhex(rm[2:]) for rm in processed["randao_mixes"]
-            ]
+            processed["block_roots"] = _hexlist_to_chunks(processed["block_roots"])
+            processed["state_roots"] = _hexlist_to_chunks(processed["state_roots"])
+            processed["randao_mixes"] = _hexlist_to_chunks(processed["randao_mixes"])
 
             return BeaconState(**processed)
+        # Every other container takes its processed fields as keyword arguments
+        return cls(**processed)
     elif isinstance(data, list):
         return [json_to_class(item, cls) for item in data]
     return data
 
 
-def load_and_process_state(state_file: str) -> 'BeaconState':
-    from .beacon import BeaconState
+def _load_json_file(path: str) -> Any:
+    """
+    Parse a JSON file with orjson straight from a read-only memory map.
+    
+    Parsing the mapped page cache avoids copying the whole file into a bytes
+    object first, which for mainnet states is tens of MB of extra peak memory.
+    """
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped; let orjson report them
+            return orjson.loads(f.read())
+        with mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
+
+def load_and_process_state(state_file: str) -> BeaconState:
+    state_data = _load_json_file(state_file)["data"]
+    # Convert validators in place so each raw dict is released as soon as its
+    # Validator exists, instead of holding both forms of the registry at once
+    validators = state_data.get("validators", [])
+    for i, v in enumerate(validators):
+        validators[i] = _validator_from_json(v)
+    return process_state_dict(state_data)
+
+
+def process_state_dict(state_data: Dict[str, Any]) -> BeaconState:
+    """
+    Build a BeaconState from already decoded beacon state JSON.
     
-    with open(state_file, "r") as f:
-        state_data = json.load(f)["data"]
+    Args:
+        state_data: The state object (the "data" field of a beacon API response)
+        
+    Returns:
+        BeaconState instance
+    """
     return json_to_class(state_data, BeaconState) 
\ No newline at end of file
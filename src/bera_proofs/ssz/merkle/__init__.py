@@ -28,15 +28,18 @@ from .tree import (
     merkleize_chunks,
     merkle_root_from_chunks,
     merkle_root_list_fixed,
+    pack_uint64_bytes,
     pack_vector_uint64,
     pack_vector_bytes32,
     get_tree_depth,
     validate_tree_structure,
+    IncrementalMerkleTree,
 )
 
 # Proof generation and verification
 from .proof import (
     get_fixed_capacity_proof,
+    get_fixed_capacity_proof_and_root,
     compute_root_from_proof,
     get_proof,
     verify_merkle_proof,
@@ -60,12 +63,15 @@ __all__ = [
     "merkleize_chunks",
     "merkle_root_from_chunks",
     "merkle_root_list_fixed",
+    "pack_uint64_bytes",
     "pack_vector_uint64",
     "pack_vector_bytes32",
     "get_tree_depth",
     "validate_tree_structure",
+    "IncrementalMerkleTree",
     # Proof functions
     "get_fixed_capacity_proof",
+    "get_fixed_capacity_proof_and_root",
     "compute_root_from_proof",
     "get_proof",
     "verify_merkle_proof",
@@ -0,0 +1,170 @@
+"""
+Merkle Level Hashing Backend
+
+This module hashes whole merkle tree levels at once. When the native
+hashtree library (https://github.com/prysmaticlabs/hashtree) is available it
+is loaded via ctypes and used to hash all pairs of a level in a single call,
+using SHA-NI or AVX2/AVX512 multi-buffer SHA256 where the CPU supports it.
+Otherwise hashing falls back to hashlib, one pair at a time.
+
+The library is looked up from the BERA_PROOFS_HASHTREE environment variable
+(full path to libhashtree.so) and then via ctypes.util.find_library.
+
+ctypes releases the GIL around native calls, so large native batches are
+split across a thread pool; hashlib only releases the GIL for inputs of
+2KiB and more, so the 64-byte fallback always runs on the calling thread.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _load_native() -> Optional[ctypes.CDLL]:
+    """Load and self-check libhashtree, returning None if unusable."""
+    path = os.getenv("BERA_PROOFS_HASHTREE") or ctypes.util.find_library("hashtree")
+    if not path:
+        return None
+    try:
+        lib = ctypes.CDLL(path)
+        lib.hashtree_init.argtypes = [ctypes.c_void_p]
+        lib.hashtree_init.restype = ctypes.c_int
+        lib.hashtree_hash.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint64]
+        lib.hashtree_hash.restype = None
+        if not lib.hashtree_init(None):
+            return None
+        # Self-check against hashlib before trusting the binding
+        block = bytes(range(64)) * 2
+        out = ctypes.create_string_buffer(64)
+        lib.hashtree_hash(ctypes.addressof(out), block, 2)
+        if out.raw != sha256(block[:64]).digest() * 2:
+            logger.warning(f"Ignoring hashtree library at {path}: self-check failed")
+            return None
+        return lib
+    except (OSError, AttributeError) as e:
+        logger.debug(f"Could not load hashtree library at {path}: {e}")
+        return None
+
+
+_native = _load_native()
+
+# True when level hashing runs in native code (which also releases the GIL)
+HAS_NATIVE_HASHTREE = _native is not None
+
+# Native batches smaller than this are hashed on the calling thread
+PARALLEL_MIN_BLOCKS = 1 << 14
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Thread pool shared by all parallel native hashing calls."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=os.cpu_count() or 1, thread_name_prefix="hashtree"
+                )
+    return _executor
+
+
+def _native_climb(level: bytes) -> bytes:
+    """Hash a power-of-two run of 32-byte nodes to its root on the calling thread."""
+    while len(level) > 32:
+        count = len(level) // 64
+        out = ctypes.create_string_buffer(count * 32)
+        _native.hashtree_hash(ctypes.addressof(out), level, count)
+        level = out.raw
+    return level
+
+
+def _native_hash_pairs(data: bytes, count: int) -> bytes:
+    """Hash count 64-byte blocks with libhashtree, in parallel for large inputs."""
+    out = ctypes.create_string_buffer(count * 32)
+    out_ptr = ctypes.addressof(out)
+    # Borrow the bytes object's buffer without copying it
+    in_ptr = ctypes.cast(ctypes.c_char_p(data), ctypes.c_void_p).value
+    workers = os.cpu_count() or 1
+    if count < PARALLEL_MIN_BLOCKS or workers == 1:
+        _native.hashtree_hash(out_ptr, in_ptr, count)
+        return out.raw
+    step = -(-count // workers)
+    futures = [
+        _get_executor().submit(
+            _native.hashtree_hash, out_ptr + start * 32, in_ptr + start * 64, min(step, count - start)
+        )
+        for start in range(0, count, step)
+    ]
+    for future in futures:
+        future.result()
+    return out.raw
+
+
+def hash_pairs(data: bytes) -> bytes:
+    """
+    SHA256 each consecutive 64-byte block of data.
+
+    Args:
+        data: Concatenated 64-byte blocks (left child || right child)
+
+    Returns:
+        Concatenated 32-byte digests, one per block
+    """
+    count = len(data) // 64
+    if _native is not None:
+        return _native_hash_pairs(bytes(data), count)
+    return b"".join(sha256(data[i:i + 64]).digest() for i in range(0, count * 64, 64))
+
+
+def hash_level(nodes: List[bytes]) -> List[bytes]:
+    """
+    Hash an even-length list of 32-byte nodes into their parents.
+
+    Args:
+        nodes: Nodes of one tree level, left and right children interleaved
+
+    Returns:
+        List of len(nodes) // 2 parent hashes
+    """
+    if _native is None:
+        return [sha256(nodes[i] + nodes[i + 1]).digest() for i in range(0, len(nodes), 2)]
+    digests = hash_pairs(b"".join(nodes))
+    return [digests[i:i + 32] for i in range(0, len(digests), 32)]
+
+
+def merkleize_level(level: bytes) -> bytes:
+    """
+    Root of a power-of-two number of 32-byte nodes given as one buffer.
+    
+    With the native library, large trees are cut into one subtree per
+    worker and each subtree is climbed to its root on its own thread, so
+    threads only synchronize once rather than at every level; the few
+    remaining top levels are hashed on the calling thread.
+    
+    Args:
+        level: Concatenated 32-byte nodes, a power of two of them
+        
+    Returns:
+        32-byte root
+    """
+    workers = os.cpu_count() or 1
+    if _native is not None and workers > 1:
+        # Largest power of two of subtrees that gives every worker a full batch
+        parts = min(workers, len(level) // (64 * PARALLEL_MIN_BLOCKS))
+        if parts > 1:
+            size = len(level) >> (parts.bit_length() - 1)
+            level = b"".join(_get_executor().map(
+                _native_climb, (level[i:i + size] for i in range(0, len(level), size))
+            ))
+    while len(level) > 32:
+        level = hash_pairs(level)
+    return level
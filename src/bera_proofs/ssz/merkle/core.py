@@ -15,13 +15,13 @@ References:
 - SSZ Specification: https://github.com/ethereum/consensus-specs/blob/dev/ssz/simple-serialize.md
 """
 
-import math
 from hashlib import sha256
 from typing import Any, List, TYPE_CHECKING
 
 # Import our own modules
 from ..constants import ZERO_HASHES, MAX_VALIDATORS, VALIDATOR_REGISTRY_LIMIT
 from ..serialization import serialize_uint64, serialize_uint256, serialize_bool, serialize_bytes
+from ._hashtree import hash_level
 
 # Avoid circular imports for type checking
 if TYPE_CHECKING:
@@ -95,12 +95,8 @@ def merkle_root_basic(value: Any, type_str: str) -> bytes:
                 f"ExtraData length {len(value)} exceeds maximum {max_length}"
             )
 
-        # Form single chunk for data
-        if len(value) == 0:
-            chunks_root = b"\0" * 32
-        else:
-            chunk = value + b"\0" * (32 - len(value))  # Pad to 32 bytes
-            chunks_root = chunk  # Single chunk, no Merkle tree needed
+        # Form single chunk for data (an empty value pads to the zero chunk)
+        chunks_root = value.ljust(32, b"\0")  # Single chunk, no Merkle tree needed
 
         # Mix in length (SSZ list requirement)
         length_packed = len(value).to_bytes(32, "little")
@@ -239,7 +235,7 @@ def merkle_root_list(roots: List[bytes]) -> bytes:
     
     # Pad to next power of two
     n = len(roots)
-    k = math.ceil(math.log2(max(n, 1)))
+    k = (n - 1).bit_length()
     num_leaves = 1 << k
     padded = roots + [b"\0" * 32] * (num_leaves - n)
     
@@ -327,12 +323,9 @@ def build_merkle_tree(leaves: List[bytes]) -> List[List[bytes]]:
     current = leaves
     
     while len(current) > 1:
-        next_level = []
-        for i in range(0, len(current), 2):
-            left = current[i]
-            right = current[i + 1] if i + 1 < len(current) else b"\0" * 32
-            parent = sha256(left + right).digest()
-            next_level.append(parent)
+        if len(current) % 2:
+            current = current + [b"\0" * 32]
+        next_level = hash_level(current)
         tree.append(next_level)
         current = next_level
     
@@ -356,7 +349,7 @@ def merkle_list_tree(roots: List[bytes]) -> bytes:
     
     # Pad to next power of two
     n = len(roots)
-    k = math.ceil(math.log2(max(n, 1)))
+    k = (n - 1).bit_length()
     num_leaves = 1 << k
     padded = roots + [b"\0" * 32] * (num_leaves - n)
     
@@ -8,7 +8,6 @@ implementation.
 
 from typing import List
 from hashlib import sha256
-import math
 
 from ..constants import (
     VALIDATOR_REGISTRY_LIMIT,
@@ -17,85 +16,9 @@ from ..constants import (
     EPOCHS_PER_SLASHINGS_VECTOR,
     MAX_VALIDATORS,
     PENDING_PARTIAL_WITHDRAWALS_LIMIT,
-    ZERO_HASHES,
+    BALANCE_CHUNK_LIMIT,
 )
-
-
-def pack_vector_uint64(values: List[int], vector_length: int) -> List[bytes]:
-    """SSZ-pack a list of uint64 (little-endian) into 32-byte chunks for a fixed-length vector."""
-    # Pad the list to fixed length with zeros
-    vals = list(values) + [0] * (vector_length - len(values))
-    # Serialize to little-endian bytes
-    data = b"".join(v.to_bytes(8, "little") for v in vals)
-    # Right-pad to 32-byte multiple
-    if len(data) % 32 != 0:
-        data += b"\x00" * (32 - (len(data) % 32))
-    # Split into 32-byte chunks
-    return [data[i : i + 32] for i in range(0, len(data), 32)]
-
-
-def pack_vector_bytes32(values: List[bytes], vector_length: int) -> List[bytes]:
-    """SSZ-pack a list of 32-byte items (given as bytes or hex strings) into 32-byte chunks."""
-    # Pad the list to fixed length with zero-bytes32
-    vals = list(values) + [b"\x00" * 32] * (vector_length - len(values))
-    # Convert each entry to bytes (if hex string, strip 0x)
-    data = b""
-    for v in vals:
-        if isinstance(v, str):
-            h = v[2:] if v.startswith("0x") else v
-            v = bytes.fromhex(h)
-        if len(v) != 32:
-            raise ValueError("Each bytes32 entry must be 32 bytes")
-        data += v
-    # (Length is already a multiple of 32, but for safety:)
-    if len(data) % 32 != 0:
-        data += b"\x00" * (32 - (len(data) % 32))
-    return [data[i : i + 32] for i in range(0, len(data), 32)]
-
-
-def merkle_root_list_fixed(chunks: List[bytes], limit: int) -> bytes:
-    """
-    Merkle-root a list of 32-byte chunks, exactly out to 'limit' leaves
-    (limit must be a power of two). Leaves beyond len(chunks) are zeros.
-    """
-    n = len(chunks)
-    assert (limit & (limit - 1)) == 0, "limit must be a power of two"
-    assert n <= limit, f"Too many leaves: {n} > {limit}"
-
-    # Step A: pad the first n chunks up to m = next_pow2(n)
-    if n == 0:
-        m = 1
-    else:
-        m = 1 << ((n - 1).bit_length())  # next power of two ≥ n
-
-    # Build bottom-level nodes
-    node_list = []
-    for i in range(m):
-        if i < n:
-            node_list.append(chunks[i])
-        else:
-            node_list.append(ZERO_HASHES[0])
-
-    # Step B: climb up from m leaves → subtree_root_of_size_m
-    levels_m = int(math.log2(m))
-    for lvl in range(levels_m):
-        next_level = []
-        for i in range(0, len(node_list), 2):
-            next_level.append(sha256(node_list[i] + node_list[i + 1]).digest())
-        node_list = next_level
-
-    subtree_root = node_list[0]  # root over m leaves
-
-    # Step C: keep doubling m → m * 2, hashing (subtree_root || ZERO_HASHES[lvl]) each time,
-    # until we reach 'limit'.
-    current_size = m
-    lvl = levels_m
-    while current_size < limit:
-        subtree_root = sha256(subtree_root + ZERO_HASHES[lvl]).digest()
-        current_size *= 2
-        lvl += 1
-
-    return subtree_root
+from .tree import merkle_root_list_fixed, pack_uint64_bytes, pack_vector_uint64, pack_vector_bytes32
 
 
 def encode_pending_partial_withdrawals_leaf_list(ppw_list_leaves: List[bytes]) -> bytes:
@@ -145,11 +68,12 @@ def encode_balances(balances: List[int]) -> bytes:
     if len(balances) > MAX_VALIDATORS:
         raise ValueError(f"Balances list too large: {len(balances)} > {MAX_VALIDATORS}")
 
-    bal_chunks = pack_vector_uint64(balances, MAX_VALIDATORS)
+    # A list needs no padding out to MAX_VALIDATORS: chunks past the end are
+    # zero subtrees, which merkle_root_list_fixed fills in from ZERO_HASHES
+    packed = pack_uint64_bytes(balances)
+    bal_chunks = [packed[i:i + 32] for i in range(0, len(packed), 32)]
 
-    # Calculate limit for Merkleization
-    limit = (VALIDATOR_REGISTRY_LIMIT * 8 + 31) // 32  # Ceiling division for chunks
-    balances_root = merkle_root_list_fixed(bal_chunks, limit)
+    balances_root = merkle_root_list_fixed(bal_chunks, BALANCE_CHUNK_LIMIT)
     balances_root = sha256(
         balances_root + len(balances).to_bytes(32, "little")
     ).digest()
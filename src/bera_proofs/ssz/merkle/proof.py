@@ -7,9 +7,10 @@ verification of specific data within larger merkle trees.
 """
 
 from hashlib import sha256
-from typing import List
+from typing import List, Tuple
 
 from ..constants import ZERO_HASHES
+from ._hashtree import hash_level
 
 
 def get_fixed_capacity_proof(
@@ -23,12 +24,34 @@ def get_fixed_capacity_proof(
     capacity must be a power of two (e.g. 2^40 for validators).
     Returns a list of log2(capacity) sibling hashes.
     """
+    return get_fixed_capacity_proof_and_root(leaves, index, capacity)[0]
+
+
+def get_fixed_capacity_proof_and_root(
+    leaves: List[bytes], index: int, capacity: int
+) -> Tuple[List[bytes], bytes]:
+    """
+    Build a fixed-capacity Merkle proof and the tree root in a single climb.
+    
+    Same proof as get_fixed_capacity_proof; the root (without length mix-in)
+    falls out of the same pass, so callers do not need to re-walk the proof
+    with compute_root_from_proof.
+    
+    Args:
+        leaves: Real leaf hashes; positions beyond len(leaves) are zero-leaves
+        index: Position of the leaf to prove
+        capacity: Total number of leaves (power of two)
+        
+    Returns:
+        Tuple of (proof, root) with log2(capacity) sibling hashes
+    """
     assert (capacity & (capacity - 1)) == 0, "capacity must be a power of two"
     n_real = len(leaves)
     assert 0 <= index < n_real, "index must lie within the real leaves"
 
-    proof: List[bytes] = []
     depth = capacity.bit_length() - 1  # since capacity = 2^depth
+    # One sibling per level, filled in by index
+    proof: List[bytes] = [b""] * depth
 
     # current_index = the position of our target leaf at the current level
     current_index = index
@@ -36,51 +59,35 @@ def get_fixed_capacity_proof(
     num_real = n_real
 
     # We'll build only the "real" subtree hashes up to the root of the real chunk.
-    # On each iteration, we compute the array `parents` that holds the real parents for the next level.
-    parents: List[bytes]
+    # On each iteration, `nodes` holds the real nodes of the current level.
+    nodes: List[bytes] = leaves
 
     for level in range(depth):
+        if num_real == 1:
+            # Only the target's own subtree holds real data from here up, so
+            # every remaining sibling is a precomputed all-zero subtree
+            proof[level:] = ZERO_HASHES[level:depth]
+            root = nodes[0]
+            for zero in ZERO_HASHES[level:depth]:
+                root = sha256(root + zero).digest()
+            return proof, root
+
+        # 1) Sibling at this level comes from the real nodes or is a zero subtree
         sibling_index = current_index ^ 1
-
-        # 1) Determine sibling_hash at this level:
-        if level == 0:
-            # Level 0: siblings come from the `leaves[]` or are zero if beyond n_real
-            if sibling_index < num_real:
-                sibling_hash = leaves[sibling_index]
-            else:
-                sibling_hash = ZERO_HASHES[0]
+        if sibling_index < num_real:
+            proof[level] = nodes[sibling_index]
         else:
-            # Level > 0: siblings come from the previous level's `parents[]` or ZERO_HASHES[level]
-            if sibling_index < len(parents):
-                sibling_hash = parents[sibling_index]
-            else:
-                sibling_hash = ZERO_HASHES[level]
-
-        proof.append(sibling_hash)
-
-        # 2) Build the next‐level "parents" array from the current real nodes only:
-        if level == 0:
-            # Start from leaf level: pair up `leaves[i]` (if i < num_real) or ZERO_HASHES[0]
-            parents = []
-            for i in range(0, num_real, 2):
-                left = leaves[i]
-                right = leaves[i + 1] if (i + 1) < num_real else ZERO_HASHES[0]
-                parents.append(sha256(left + right).digest())
-            num_real = (num_real + 1) // 2
-        else:
-            # We already have a `parents` from the previous iteration's "left/right hashing."
-            new_parents: List[bytes] = []
-            # Only iterate over *actual* real parents, not capacity
-            for i in range(0, num_real, 2):
-                left = parents[i]
-                right = parents[i + 1] if (i + 1) < num_real else ZERO_HASHES[level]
-                new_parents.append(sha256(left + right).digest())
-            parents = new_parents
-            num_real = (num_real + 1) // 2
+            proof[level] = ZERO_HASHES[level]
+
+        # 2) Build the next-level real nodes, padding an odd tail with ZERO_HASHES[level]
+        if num_real % 2:
+            nodes = nodes + [ZERO_HASHES[level]]
+        nodes = hash_level(nodes)
+        num_real = len(nodes)
 
         current_index //= 2
 
-    return proof
+    return proof, nodes[0]
 
 
 def compute_root_from_proof(leaf: bytes, index: int, proof: List[bytes]) -> bytes:
@@ -99,14 +106,13 @@ def compute_root_from_proof(leaf: bytes, index: int, proof: List[bytes]) -> byte
         >>> root = compute_root_from_proof(leaf_hash, 5, proof_siblings)
     """
     current = leaf
-    for level, sibling in enumerate(proof):
-        # Check the bit at position `level` in `index`:
-        if ((index >> level) & 1) == 0:
-            # Our node was on the left, sibling is on the right
-            current = sha256(current + sibling).digest()
-        else:
-            # Our node was on the right, sibling is on the left
+    for sibling in proof:
+        # The low bit of `index` says which side our node is on at this level
+        if index & 1:
             current = sha256(sibling + current).digest()
+        else:
+            current = sha256(current + sibling).digest()
+        index >>= 1
     return current
 
 
@@ -130,7 +136,7 @@ def get_proof(tree: List[List[bytes]], index: int) -> List[bytes]:
         >>> proof = get_proof(tree, 1)  # Proof for leaf1
         >>> # proof contains siblings needed to reconstruct root
     """
-    proof = []
+    proof = [b""] * (len(tree) - 1)
     level = 0
     i = index
     
@@ -140,7 +146,7 @@ def get_proof(tree: List[List[bytes]], index: int) -> List[bytes]:
             sibling = tree[level][sibling_i]
         else:
             sibling = b"\0" * 32  # Zero padding for incomplete levels
-        proof.append(sibling)
+        proof[level] = sibling
         i //= 2  # Move to parent index
         level += 1
         
@@ -165,14 +171,7 @@ def verify_merkle_proof(
     Examples:
         >>> is_valid = verify_merkle_proof(leaf, proof, 5, expected_root)
     """
-    current = leaf
-    for sibling in proof:
-        if index % 2 == 0:
-            current = sha256(current + sibling).digest()  # Leaf is left
-        else:
-            current = sha256(sibling + current).digest()  # Leaf is right
-        index //= 2  # Move up the tree
-    return current == root
+    return compute_root_from_proof(leaf, index, proof) == root
 
 
 def validate_proof_length(proof: List[bytes], tree_depth: int) -> bool:
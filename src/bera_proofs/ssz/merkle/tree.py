@@ -6,11 +6,13 @@ including functions for efficient tree construction, chunk processing,
 and specialized operations for SSZ types.
 """
 
-import math
+from functools import lru_cache
 from hashlib import sha256
 from typing import List
 
 from ..constants import ZERO_HASHES, VALIDATOR_REGISTRY_LIMIT
+from ..serialization import serialize_uint64_array
+from ._hashtree import hash_level, hash_pairs, merkleize_level
 
 
 def merkleize_chunks(chunks: List[bytes], limit: int) -> bytes:
@@ -27,16 +29,16 @@ def merkleize_chunks(chunks: List[bytes], limit: int) -> bytes:
     Returns:
         32-byte merkle root
     """
-    tree = chunks[:]
-    while len(tree) > 1:
-        new_tree = []
-        for i in range(0, len(tree), 2):
-            left = tree[i]
-            right = tree[i + 1] if i + 1 < len(tree) else b"\x00" * 32
-            combined = left + right
-            new_tree.append(sha256(combined).digest())
-        tree = new_tree
-    return tree[0] if tree else b"\x00" * 32
+    if len(chunks) <= 1:
+        return chunks[0] if chunks else ZERO_HASHES[0]
+    
+    # Keep each level as one flat buffer; an odd tail is paired with a zero chunk
+    level = b"".join(chunks)
+    while len(level) > 32:
+        if len(level) % 64:
+            level += ZERO_HASHES[0]
+        level = hash_pairs(level)
+    return level
 
 
 def merkle_root_from_chunks(chunks: List[bytes]) -> bytes:
@@ -51,14 +53,22 @@ def merkle_root_from_chunks(chunks: List[bytes]) -> bytes:
     Returns:
         32-byte merkle root
     """
-    chunks = _pad_to_power_of_two(chunks)
-    while len(chunks) > 1:
-        paired = []
-        for i in range(0, len(chunks), 2):
-            left, right = chunks[i], chunks[i + 1]
-            paired.append(sha256(left + right).digest())
-        chunks = paired
-    return chunks[0]
+    if len(chunks) <= 1:
+        return chunks[0] if chunks else ZERO_HASHES[0]
+    
+    return merkleize_level(b"".join(_pad_to_power_of_two(chunks)))
+
+
+# Bottom subtrees of at most this many leaves are memoized by content
+SMALL_SUBTREE_LEAVES = 8
+
+
+@lru_cache(maxsize=4096)
+def _small_subtree_root(level: bytes) -> bytes:
+    """Root of a small power-of-two subtree given as one buffer of 32-byte leaves."""
+    while len(level) > 32:
+        level = hash_pairs(level)
+    return level
 
 
 def merkle_root_list_fixed(chunks: List[bytes], limit: int) -> bytes:
@@ -86,38 +96,40 @@ def merkle_root_list_fixed(chunks: List[bytes], limit: int) -> bytes:
     if n > limit:
         raise ValueError(f"Too many leaves: {n} > {limit}")
 
+    # Trailing zero chunks (e.g. balances packed out to MAX_VALIDATORS) are
+    # indistinguishable from the zero padding up to 'limit', so drop them and
+    # let the precomputed zero-subtree hashes below stand in for them
+    data = b"".join(chunks)
+    n = -(-len(data.rstrip(b"\0")) // 32)
+    data = data[:32 * n]
+
+    # An empty list is an all-zero tree, whose root is precomputed
+    depth = limit.bit_length() - 1
+    if n == 0 and depth < len(ZERO_HASHES):
+        return ZERO_HASHES[depth]
+
     # Step A: pad the first n chunks up to m = next_pow2(n)
     if n == 0:
         m = 1
     else:
         m = 1 << ((n - 1).bit_length())  # next power of two ≥ n
 
-    # Build bottom-level nodes
-    node_list = []
-    for i in range(m):
-        if i < n:
-            node_list.append(chunks[i])
-        else:
-            node_list.append(ZERO_HASHES[0])
-
-    # Step B: climb up from m leaves → subtree_root_of_size_m
-    levels_m = int(math.log2(m))
-    for lvl in range(levels_m):
-        next_level = []
-        for i in range(0, len(node_list), 2):
-            next_level.append(sha256(node_list[i] + node_list[i + 1]).digest())
-        node_list = next_level
+    # Build the bottom level as one contiguous buffer of m 32-byte nodes
+    level = data + ZERO_HASHES[0] * (m - n)
 
-    subtree_root = node_list[0]  # root over m leaves
+    # Step B: climb up from m leaves → subtree_root_of_size_m; each level is
+    # hashed in one batch straight from the buffer of the level below
+    levels_m = m.bit_length() - 1
+    if m <= SMALL_SUBTREE_LEAVES:
+        subtree_root = _small_subtree_root(level)
+    else:
+        subtree_root = merkleize_level(level)  # root over m leaves
 
     # Step C: keep doubling m → m * 2, hashing (subtree_root || ZERO_HASHES[lvl]) each time,
-    # until we reach 'limit'.
-    current_size = m
-    lvl = levels_m
-    while current_size < limit:
+    # until we reach 'limit'. The depth is known up front, so this is a fixed
+    # run of hashes against the precomputed table with no size bookkeeping.
+    for lvl in range(levels_m, depth):
         subtree_root = sha256(subtree_root + ZERO_HASHES[lvl]).digest()
-        current_size *= 2
-        lvl += 1
 
     return subtree_root
 
@@ -135,12 +147,41 @@ def _pad_to_power_of_two(chunks: List[bytes]) -> List[bytes]:
     n = len(chunks)
     if n == 0:
         return [b"\x00" * 32]
+    if n & (n - 1) == 0:
+        return chunks  # Already a power of two
     
     # Next power-of-two ≥ n
     m = 1 << (n - 1).bit_length()
     return chunks + [b"\x00" * 32] * (m - n)
 
 
+def pack_uint64_bytes(values: List[int], vector_length: int = 0) -> bytes:
+    """
+    SSZ-pack uint64 values into one contiguous little-endian blob.
+    
+    The blob is zero-padded out to vector_length values and then to a whole
+    number of 32-byte chunks, so chunk i is simply data[32 * i:32 * (i + 1)]
+    and no per-chunk objects need to be created.
+    
+    Args:
+        values: List of uint64 values
+        vector_length: Minimum number of values to pad to
+        
+    Returns:
+        Packed bytes, a multiple of 32 long
+        
+    Examples:
+        >>> len(pack_uint64_bytes([1, 2, 3, 4, 5]))  # Two chunks
+        64
+    """
+    # Serialize to little-endian bytes (8 bytes per uint64) in a single call,
+    # then zero-pad out to the fixed vector length and a 32-byte multiple
+    data = serialize_uint64_array(values)
+    size = 8 * max(vector_length, len(values))
+    size += -size % 32
+    return data + bytes(size - len(data))
+
+
 def pack_vector_uint64(values: List[int], vector_length: int) -> List[bytes]:
     """
     SSZ-pack a list of uint64 values into 32-byte chunks for a fixed-length vector.
@@ -155,15 +196,7 @@ def pack_vector_uint64(values: List[int], vector_length: int) -> List[bytes]:
     Examples:
         >>> pack_vector_uint64([1, 2, 3], 8)  # Pads to 8 elements
     """
-    # Pad the list to fixed length with zeros
-    vals = list(values) + [0] * (vector_length - len(values))
-    
-    # Serialize to little-endian bytes (8 bytes per uint64)
-    data = b"".join(v.to_bytes(8, "little") for v in vals)
-    
-    # Right-pad to 32-byte multiple
-    if len(data) % 32 != 0:
-        data += b"\x00" * (32 - (len(data) % 32))
+    data = pack_uint64_bytes(values, vector_length)
     
     # Split into 32-byte chunks
     return [data[i : i + 32] for i in range(0, len(data), 32)]
@@ -183,25 +216,170 @@ def pack_vector_bytes32(values: List[bytes], vector_length: int) -> List[bytes]:
     Examples:
         >>> pack_vector_bytes32([b'\\x01'*32, b'\\x02'*32], 8)
     """
-    # Pad the list to fixed length with zero-bytes32
-    vals = list(values) + [b"\x00" * 32] * (vector_length - len(values))
+    # Pre-sized zero buffer, so padding to the fixed length is free
+    out = bytearray(32 * max(vector_length, len(values)))
     
-    # Convert each entry to bytes (if hex string, strip 0x)
-    data = b""
-    for v in vals:
+    # Copy each entry into place (if hex string, strip 0x)
+    for i, v in enumerate(values):
         if isinstance(v, str):
             h = v[2:] if v.startswith("0x") else v
             v = bytes.fromhex(h)
         if len(v) != 32:
             raise ValueError("Each bytes32 entry must be 32 bytes")
-        data += v
+        out[32 * i:32 * i + 32] = v
     
-    # Split into 32-byte chunks (length is already multiple of 32)
-    if len(data) % 32 != 0:
-        data += b"\x00" * (32 - (len(data) % 32))
+    # Split into 32-byte chunks
+    data = bytes(out)
     return [data[i : i + 32] for i in range(0, len(data), 32)]
 
 
+class IncrementalMerkleTree:
+    """
+    Fixed-capacity merkle tree that keeps its internal levels between updates.
+    
+    Only the "real" part of the tree is stored: level 0 holds the leaves and
+    each level above holds ceil(n / 2**level) parents, with missing right
+    siblings taken from ZERO_HASHES. Changing a leaf rehashes just the path
+    from that leaf to the root, so a tree kept across states costs
+    O(changed leaves * depth) hashes instead of rebuilding every level.
+    
+    Proofs and roots match get_fixed_capacity_proof and merkle_root_list_fixed
+    for the same leaves and capacity.
+    
+    Examples:
+        >>> tree = IncrementalMerkleTree(leaves, VALIDATOR_REGISTRY_LIMIT)
+        >>> tree.update(5, new_leaf)
+        >>> proof = tree.proof(5)
+    """
+    
+    def __init__(self, leaves: List[bytes], capacity: int):
+        if not (capacity & (capacity - 1) == 0):
+            raise ValueError("capacity must be a power of two")
+        if len(leaves) > capacity:
+            raise ValueError(f"Too many leaves: {len(leaves)} > {capacity}")
+        self.capacity = capacity
+        self.depth = capacity.bit_length() - 1
+        self._build(list(leaves))
+    
+    def _build(self, leaves: List[bytes]) -> None:
+        """Hash all levels from scratch for the given leaves."""
+        levels = [leaves]
+        nodes = leaves
+        for level in range(self.depth):
+            if len(nodes) % 2:
+                nodes = nodes + [ZERO_HASHES[level]]
+            nodes = hash_level(nodes)
+            levels.append(nodes)
+        self.levels = levels
+    
+    def __len__(self) -> int:
+        return len(self.levels[0])
+    
+    @property
+    def leaves(self) -> List[bytes]:
+        """Current leaf level (do not mutate; use update instead)."""
+        return self.levels[0]
+    
+    def root(self) -> bytes:
+        """Root of the full capacity-sized tree (without length mix-in)."""
+        top = self.levels[-1]
+        return top[0] if top else ZERO_HASHES[self.depth]
+    
+    def update(self, index: int, leaf: bytes) -> None:
+        """
+        Replace an existing leaf and rehash its path to the root.
+        
+        Args:
+            index: Position of the leaf to replace
+            leaf: New 32-byte leaf value
+        """
+        levels = self.levels
+        if not 0 <= index < len(levels[0]):
+            raise IndexError(f"Leaf index {index} out of range (0-{len(levels[0]) - 1})")
+        levels[0][index] = leaf
+        for level in range(self.depth):
+            nodes = levels[level]
+            left = index & ~1
+            right = nodes[left + 1] if left + 1 < len(nodes) else ZERO_HASHES[level]
+            index >>= 1
+            levels[level + 1][index] = sha256(nodes[left] + right).digest()
+    
+    def sync(self, leaves: List[bytes]) -> int:
+        """
+        Bring the tree in line with a new leaf list.
+        
+        Leaves that differ are updated in place and leaves appended to the
+        list are added with append. If the list shrank the tree is rebuilt.
+        
+        Args:
+            leaves: Full list of current leaves
+            
+        Returns:
+            Number of leaves that were rehashed
+        """
+        current = self.levels[0]
+        if len(leaves) > self.capacity:
+            raise ValueError(f"Too many leaves: {len(leaves)} > {self.capacity}")
+        if len(leaves) < len(current):
+            self._build(list(leaves))
+            return len(leaves)
+        n = len(current)
+        changed = [i for i, (old, new) in enumerate(zip(current, leaves)) if old != new]
+        for i in changed:
+            self.update(i, leaves[i])
+        if len(leaves) > n:
+            self.append(leaves[n:])
+        return len(changed) + len(leaves) - n
+    
+    def append(self, new_leaves: List[bytes]) -> None:
+        """
+        Add leaves after the current last leaf.
+        
+        Only the parents to the right of the old last leaf are rehashed, so
+        a list that grows between states never rebuilds the levels below
+        its existing leaves.
+        
+        Args:
+            new_leaves: Leaves to add, in order
+        """
+        levels = self.levels
+        start = len(levels[0])
+        if start + len(new_leaves) > self.capacity:
+            raise ValueError(f"Too many leaves: {start + len(new_leaves)} > {self.capacity}")
+        levels[0].extend(new_leaves)
+        for level in range(self.depth):
+            # The old last parent may have hashed a zero right sibling, so
+            # rehash from its position onwards
+            start >>= 1
+            nodes = levels[level][2 * start:]
+            if len(nodes) % 2:
+                nodes.append(ZERO_HASHES[level])
+            parents = levels[level + 1]
+            del parents[start:]
+            parents.extend(hash_level(nodes))
+    
+    def proof(self, index: int) -> List[bytes]:
+        """
+        Sibling hashes for the leaf at index, from the leaf level upwards.
+        
+        Args:
+            index: Position of the leaf to prove
+            
+        Returns:
+            List of depth sibling hashes
+        """
+        levels = self.levels
+        if not 0 <= index < len(levels[0]):
+            raise IndexError(f"Leaf index {index} out of range (0-{len(levels[0]) - 1})")
+        proof = [b""] * self.depth
+        for level in range(self.depth):
+            nodes = levels[level]
+            sibling = index ^ 1
+            proof[level] = nodes[sibling] if sibling < len(nodes) else ZERO_HASHES[level]
+            index >>= 1
+        return proof
+
+
 def get_tree_depth(capacity: int) -> int:
     """
     Calculate the depth of a merkle tree for given capacity.
@@ -11,7 +11,26 @@ References:
 - SSZ Specification: https://github.com/ethereum/consensus-specs/blob/dev/ssz/simple-serialize.md
 """
 
-from typing import Union
+import re
+import struct
+from functools import lru_cache
+from typing import Sequence, Union
+
+# Precompiled little-endian packers for the fixed-width unsigned integers
+_pack_u64 = struct.Struct("<Q").pack
+_pack_u32 = struct.Struct("<I").pack
+_pack_u16 = struct.Struct("<H").pack
+_pack_u8 = struct.Struct("<B").pack
+_unpack_u64 = struct.Struct("<Q").unpack
+_from_bytes = int.from_bytes
+
+# Encodings of small values (zero, epochs, flags, ...) are shared rather than
+# packed on every call; bytes are immutable so handing them out is safe
+SMALL_INT_CACHE_SIZE = 1024
+_SMALL_U64 = tuple(_pack_u64(i) for i in range(SMALL_INT_CACHE_SIZE))
+_SMALL_U32 = tuple(_pack_u32(i) for i in range(SMALL_INT_CACHE_SIZE))
+_SMALL_U16 = tuple(_pack_u16(i) for i in range(SMALL_INT_CACHE_SIZE))
+_U8 = tuple(_pack_u8(i) for i in range(256))
 
 
 def serialize_uint64(value: int) -> bytes:
@@ -38,12 +57,40 @@ def serialize_uint64(value: int) -> bytes:
         >>> serialize_uint64(1234567890)
         b'\\xd2\\x02\\x96\\x49\\x00\\x00\\x00\\x00'
     """
+    if 0 <= value < SMALL_INT_CACHE_SIZE:
+        return _SMALL_U64[value]
     if value < 0:
         raise ValueError("uint64 values must be non-negative")
     if value >= 2**64:
         raise OverflowError("Value too large for uint64")
     
-    return value.to_bytes(8, "little")
+    return _pack_u64(value)
+
+
+def serialize_uint64_array(values: Sequence[int]) -> bytes:
+    """
+    Serialize a sequence of 64-bit unsigned integers back to back.
+    
+    Equivalent to b"".join(map(serialize_uint64, values)), but packed by a
+    single struct call, so the per-element work stays in C.
+    
+    Args:
+        values: Integer values (each 0 <= value < 2^64)
+        
+    Returns:
+        8 * len(values) bytes of little-endian uint64s
+        
+    Raises:
+        OverflowError: If any value is outside the uint64 range
+        
+    Examples:
+        >>> serialize_uint64_array([1, 2])
+        b'\\x01\\x00\\x00\\x00\\x00\\x00\\x00\\x00\\x02\\x00\\x00\\x00\\x00\\x00\\x00\\x00'
+    """
+    try:
+        return struct.pack(f"<{len(values)}Q", *values)
+    except struct.error as e:
+        raise OverflowError(f"Value out of range for uint64: {e}") from e
 
 
 def serialize_uint256(value: int) -> bytes:
@@ -86,12 +133,14 @@ def serialize_uint32(value: int) -> bytes:
     Returns:
         4-byte little-endian representation
     """
+    if 0 <= value < SMALL_INT_CACHE_SIZE:
+        return _SMALL_U32[value]
     if value < 0:
         raise ValueError("uint32 values must be non-negative")
     if value >= 2**32:
         raise OverflowError("Value too large for uint32")
     
-    return value.to_bytes(4, "little")
+    return _pack_u32(value)
 
 
 def serialize_uint16(value: int) -> bytes:
@@ -104,12 +153,14 @@ def serialize_uint16(value: int) -> bytes:
     Returns:
         2-byte little-endian representation
     """
+    if 0 <= value < SMALL_INT_CACHE_SIZE:
+        return _SMALL_U16[value]
     if value < 0:
         raise ValueError("uint16 values must be non-negative")
     if value >= 2**16:
         raise OverflowError("Value too large for uint16")
     
-    return value.to_bytes(2, "little")
+    return _pack_u16(value)
 
 
 def serialize_uint8(value: int) -> bytes:
@@ -122,12 +173,14 @@ def serialize_uint8(value: int) -> bytes:
     Returns:
         1-byte representation
     """
+    if 0 <= value < 256:
+        return _U8[value]
     if value < 0:
         raise ValueError("uint8 values must be non-negative")
     if value >= 2**8:
         raise OverflowError("Value too large for uint8")
     
-    return value.to_bytes(1, "little")
+    return _pack_u8(value)
 
 
 def serialize_bool(value: bool) -> bytes:
@@ -179,6 +232,23 @@ def serialize_bytes(value: bytes, length: int) -> bytes:
     return value
 
 
+def serialize_bytes_unchecked(value: bytes, length: int) -> bytes:
+    """
+    Serialize a fixed-length byte array without checking its length.
+    
+    Only for callers that have already validated the length themselves;
+    a wrong-length value is passed through and merkleizes to a wrong root.
+    
+    Args:
+        value: Byte array to serialize, already known to be `length` bytes
+        length: Expected length in bytes (unused)
+        
+    Returns:
+        The input bytes unchanged
+    """
+    return value
+
+
 def serialize_bytes_dynamic(value: bytes) -> bytes:
     """
     Serialize a variable-length byte array to SSZ format.
@@ -211,7 +281,7 @@ def deserialize_uint64(data: bytes) -> int:
     if len(data) != 8:
         raise ValueError(f"Expected 8 bytes for uint64, got {len(data)}")
     
-    return int.from_bytes(data, "little")
+    return _unpack_u64(data)[0]
 
 
 def deserialize_uint256(data: bytes) -> int:
@@ -230,7 +300,11 @@ def deserialize_uint256(data: bytes) -> int:
     if len(data) != 32:
         raise ValueError(f"Expected 32 bytes for uint256, got {len(data)}")
     
-    return int.from_bytes(data, "little")
+    return _from_bytes(data, "little")
+
+
+# Decoded value of each valid boolean byte
+_BOOL_VALUES = {0: False, 1: True}
 
 
 def deserialize_bool(data: bytes) -> bool:
@@ -249,12 +323,27 @@ def deserialize_bool(data: bytes) -> bool:
     if len(data) != 1:
         raise ValueError(f"Expected 1 byte for boolean, got {len(data)}")
     
-    if data[0] == 0:
-        return False
-    elif data[0] == 1:
-        return True
-    else:
+    value = _BOOL_VALUES.get(data[0])
+    if value is None:
         raise ValueError(f"Invalid boolean byte: {data[0]:02x}")
+    return value
+
+
+# Serialized sizes of the fixed-size SSZ types
+_TYPE_SIZES = {
+    'uint8': 1,
+    'uint16': 2,
+    'uint32': 4,
+    'uint64': 8,
+    'uint256': 32,
+    'Boolean': 1,
+    'bytes1': 1,
+    'bytes4': 4,
+    'bytes20': 20,
+    'bytes32': 32,
+    'bytes48': 48,
+    'bytes256': 256,
+}
 
 
 def get_serialized_size(type_str: str) -> int:
@@ -275,31 +364,22 @@ def get_serialized_size(type_str: str) -> int:
         >>> get_serialized_size('bytes')
         -1
     """
-    type_sizes = {
-        'uint8': 1,
-        'uint16': 2,
-        'uint32': 4,
-        'uint64': 8,
-        'uint256': 32,
-        'Boolean': 1,
-        'bytes1': 1,
-        'bytes4': 4,
-        'bytes20': 20,
-        'bytes32': 32,
-        'bytes48': 48,
-        'bytes256': 256,
-    }
-    
-    if type_str in type_sizes:
-        return type_sizes[type_str]
-    
+    size = _TYPE_SIZES.get(type_str)
+    if size is not None:
+        return size
+    return _bytes_n_size(type_str)
+
+
+_BYTES_N_RE = re.compile(r"bytes([0-9]+)")
+
+
+@lru_cache(maxsize=128)
+def _bytes_n_size(type_str: str) -> int:
+    """Size of a bytesN type string, or -1 for variable-length and complex types."""
     # Handle bytesN patterns
-    if type_str.startswith('bytes') and type_str[5:].isdigit():
-        return int(type_str[5:])
-    
-    # Variable-length types
-    if type_str in ['bytes', 'string']:
-        return -1
+    match = _BYTES_N_RE.fullmatch(type_str)
+    if match:
+        return int(match.group(1))
     
-    # Complex types are variable-length
-    return -1 
\ No newline at end of file
+    # Variable-length ('bytes', 'string') and complex types
+    return -1
@@ -10,6 +10,7 @@ from .hex_helpers import (
     camel_to_snake,
     hex_to_bytes,
     bytes_to_hex,
+    bytes_list_to_hex,
     validate_hex_length,
 )
 
@@ -18,5 +19,6 @@ __all__ = [
     'camel_to_snake', 
     'hex_to_bytes',
     'bytes_to_hex',
+    'bytes_list_to_hex',
     'validate_hex_length',
 ] 
\ No newline at end of file
@@ -6,7 +6,7 @@ different naming conventions used in JSON data and Python code.
 """
 
 import re
-from typing import Optional
+from typing import Iterable, List, Optional
 
 
 def normalize_hex(hex_str: str, expected_bytes: Optional[int] = None) -> str:
@@ -97,8 +97,7 @@ def hex_to_bytes(hex_str: str) -> bytes:
         >>> hex_to_bytes("1234")
         b'\x12\x34'
     """
-    if hex_str.startswith("0x"):
-        hex_str = hex_str[2:]
+    hex_str = hex_str.removeprefix("0x")
     
     # Pad to even length
     if len(hex_str) % 2 == 1:
@@ -124,8 +123,30 @@ def bytes_to_hex(data: bytes, prefix: bool = True) -> str:
         >>> bytes_to_hex(b'\x12\x34', prefix=False)
         "1234"
     """
-    hex_str = data.hex()
-    return f"0x{hex_str}" if prefix else hex_str
+    return "0x" + data.hex() if prefix else data.hex()
+
+
+def bytes_list_to_hex(values: Iterable[bytes], prefix: bool = True) -> List[str]:
+    """
+    Convert a sequence of byte strings (e.g. proof steps) to hex strings.
+    
+    Uses the C-level ``bytes.hex`` through ``map`` and a single prefix
+    concatenation per item instead of formatting each element separately.
+    
+    Args:
+        values: Byte strings to convert
+        prefix: Whether to include '0x' prefix
+        
+    Returns:
+        List of hex string representations, in input order
+        
+    Examples:
+        >>> bytes_list_to_hex([b'\x12\x34', b'\xab'])
+        ["0x1234", "0xab"]
+    """
+    if not prefix:
+        return list(map(bytes.hex, values))
+    return ["0x" + hex_str for hex_str in map(bytes.hex, values)]
 
 
 def validate_hex_length(hex_str: str, expected_bytes: int) -> bool:
@@ -0,0 +1,105 @@
+"""
+Tests for container JSON conversion helpers
+
+Verifies that bytes32 hex vectors decode to the same chunks as decoding each
+entry on its own, and that malformed entries are not silently re-aligned.
+"""
+
+import unittest
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+from unittest import mock
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bera_proofs.ssz.containers import utils
+from bera_proofs.ssz.containers.utils import (
+    _hexlist_to_chunks,
+    _validator_from_json,
+    load_and_process_state,
+)
+from bera_proofs.ssz.merkle.tree import pack_vector_bytes32
+
+STATE_FILE = os.path.join(os.path.dirname(__file__), '..', 'test', 'data', 'state.json')
+
+
+class TestHexlistToChunks(unittest.TestCase):
+    """Compare _hexlist_to_chunks against per-entry bytes.fromhex."""
+
+    def test_bytes32_entries(self):
+        """Well-formed entries decode to their 32-byte values, in order"""
+        values = [sha256(i.to_bytes(8, "little")).digest() for i in range(9)]
+        hexes = ["0x" + v.hex() for v in values]
+        self.assertEqual(_hexlist_to_chunks(hexes), values)
+        self.assertEqual(_hexlist_to_chunks([]), [])
+
+    def test_misaligned_entries_keep_their_lengths(self):
+        """Short and long entries summing to whole chunks are not re-split"""
+        chunks = _hexlist_to_chunks(["0x" + "ab" * 31, "0x" + "cd" * 33])
+        self.assertEqual(chunks, [b"\xab" * 31, b"\xcd" * 33])
+        with self.assertRaises(ValueError):
+            pack_vector_bytes32(chunks, 8)
+
+    def test_odd_length_entry_raises(self):
+        """An odd-length entry fails even if the joined text would decode"""
+        with self.assertRaises(ValueError):
+            _hexlist_to_chunks(["0x" + "a" * 63, "0x" + "b" * 65])
+
+
+def _validator_json(i):
+    return {
+        "pubkey": "0x" + sha256(i.to_bytes(8, "little")).hexdigest() + "ab" * 16,
+        "withdrawal_credentials": "0x" + "01" * 32,
+        "effective_balance": hex(32 * 10**9 + i),
+        "slashed": False,
+        "activation_eligibility_epoch": "0x0",
+        "activation_epoch": "0x0",
+        "exit_epoch": "0xffffffffffffffff",
+        "withdrawable_epoch": "0xffffffffffffffff",
+    }
+
+
+class TestValidatorCache(unittest.TestCase):
+    """Check the cross-load Validator cache."""
+
+    def setUp(self):
+        utils._validator_cache.clear()
+
+    def test_loads_share_no_validators(self):
+        """Separately loaded states get their own Validator instances"""
+        first = load_and_process_state(STATE_FILE)
+        second = load_and_process_state(STATE_FILE)
+        self.assertEqual(first.validators, second.validators)
+        self.assertFalse({id(v) for v in first.validators} & {id(v) for v in second.validators})
+
+        original = second.validators[0].effective_balance
+        first.validators[0].effective_balance += 1
+        first.validators[1].slashed = True
+        self.assertEqual(second.validators[0].effective_balance, original)
+        self.assertFalse(second.validators[1].slashed)
+        third = load_and_process_state(STATE_FILE)
+        self.assertEqual(third.validators, second.validators)
+
+    def test_concurrent_eviction(self):
+        """Threads inserting into a full cache evict without errors"""
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+
+        def run(start):
+            return [_validator_from_json(_validator_json(i)).effective_balance
+                    for i in range(start, start + 200)]
+
+        with mock.patch.object(utils, "VALIDATOR_CACHE_SIZE", 32):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(run, range(0, 3200, 100)))
+            self.assertLessEqual(len(utils._validator_cache), 32)
+        for start, balances in zip(range(0, 3200, 100), results):
+            self.assertEqual(balances, [32 * 10**9 + i for i in range(start, start + 200)])
+
+
+if __name__ == "__main__":
+    unittest.main()
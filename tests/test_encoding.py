@@ -0,0 +1,85 @@
+"""
+Tests for list encodings
+
+Verifies that encode_balances, which packs balances to their own length,
+still gives the root of the former MAX_VALIDATORS-padded vector, including
+for lists whose last chunks are all zero.
+"""
+
+import unittest
+import sys
+import os
+import struct
+from hashlib import sha256
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bera_proofs.ssz import BALANCE_CHUNK_LIMIT, MAX_VALIDATORS, encode_balances
+from bera_proofs.ssz.containers.utils import load_and_process_state
+from bera_proofs.ssz.merkle.tree import merkle_root_list_fixed
+
+STATE_FILE = os.path.join(os.path.dirname(__file__), '..', 'test', 'data', 'state.json')
+
+
+def _reference_list_root(chunks, limit):
+    """Naive merkle root of chunks padded with zero subtrees to limit leaves."""
+    zero = b"\0" * 32
+    level = list(chunks)
+    for _ in range((limit - 1).bit_length()):
+        if len(level) % 2 or not level:
+            level.append(zero)
+        level = [sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level), 2)]
+        zero = sha256(zero + zero).digest()
+    return level[0]
+
+
+def _padded_balances_root(balances):
+    """encode_balances as it was: packed and padded out to MAX_VALIDATORS."""
+    data = struct.pack(f"<{len(balances)}Q", *balances).ljust(MAX_VALIDATORS * 8, b"\0")
+    chunks = [data[i:i + 32] for i in range(0, len(data), 32)]
+    root = _reference_list_root(chunks, BALANCE_CHUNK_LIMIT)
+    return sha256(root + len(balances).to_bytes(32, "little")).digest()
+
+
+class TestEncodeBalances(unittest.TestCase):
+    """Compare encode_balances against the padded-vector form."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.balances = list(load_and_process_state(STATE_FILE).balances)
+
+    def test_fixture_state(self):
+        """The fixture balances root is unchanged"""
+        self.assertEqual(encode_balances(self.balances), _padded_balances_root(self.balances))
+
+    def test_trailing_zero_balances(self):
+        """Zero balances at the end, filling whole chunks or not, keep their root"""
+        for balances in (
+            self.balances + [0] * 11,
+            self.balances[:64] + [0] * 8,
+            [0] * 5,
+            [32 * 10**9, 0, 0, 0],
+            [],
+        ):
+            root = encode_balances(balances)
+            self.assertEqual(root, _padded_balances_root(balances), len(balances))
+        # The length mix-in still tells trailing zeros apart
+        self.assertNotEqual(encode_balances(self.balances + [0] * 4), encode_balances(self.balances))
+
+
+class TestListRootTrailingZeros(unittest.TestCase):
+    """Compare merkle_root_list_fixed against a naive padded tree."""
+
+    def test_last_chunks_zero(self):
+        """Chunk lists ending in zero chunks match the naive root"""
+        zero = b"\0" * 32
+        real = [sha256(i.to_bytes(8, "little")).digest() for i in range(5)]
+        for chunks in (real + [zero], real + [zero] * 3, [zero] * 4, [zero], real[:1] + [zero] * 7):
+            for limit in (8, 64, BALANCE_CHUNK_LIMIT):
+                self.assertEqual(merkle_root_list_fixed(chunks, limit),
+                                 _reference_list_root(chunks, limit), (len(chunks), limit))
+
+
+if __name__ == "__main__":
+    unittest.main()
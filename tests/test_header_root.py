@@ -0,0 +1,88 @@
+"""
+Tests for BeaconBlockHeader.root_with_state_root
+
+Verifies that the cached header subtrees give the same roots as the generic
+header merkleization, that they follow edits to the header, and that proof
+generation leaves an in-memory state reusable.
+"""
+
+import unittest
+import sys
+import os
+from dataclasses import replace
+from hashlib import sha256
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bera_proofs.main import (
+    ZERO_STATE_ROOT,
+    generate_balance_proof_from_state,
+    generate_validator_proof_from_state,
+)
+from bera_proofs.ssz import BeaconBlockHeader
+from bera_proofs.ssz.containers.utils import load_and_process_state
+
+STATE_FILE = os.path.join(os.path.dirname(__file__), '..', 'test', 'data', 'state.json')
+
+
+def _generic_root(header, state_root):
+    return replace(header, state_root=state_root).merkle_tree()[-1][0]
+
+
+class TestHeaderRoot(unittest.TestCase):
+    """Compare root_with_state_root against merkle_tree()."""
+
+    def setUp(self):
+        self.header = BeaconBlockHeader(
+            slot=123456,
+            proposer_index=42,
+            parent_root=sha256(b"parent").digest(),
+            state_root=sha256(b"state").digest(),
+            body_root=sha256(b"body").digest(),
+        )
+
+    def test_zero_and_nonzero_state_root(self):
+        """Both state roots match, in either order and repeated"""
+        other = sha256(b"other").digest()
+        for state_root in (ZERO_STATE_ROOT, other, self.header.state_root, ZERO_STATE_ROOT):
+            self.assertEqual(self.header.root_with_state_root(state_root),
+                             _generic_root(self.header, state_root))
+        self.assertEqual(self.header.merkle_root(), self.header.merkle_tree()[-1][0])
+        self.assertEqual(self.header.state_root, sha256(b"state").digest())
+
+    def test_field_changes_on_same_instance(self):
+        """Editing any cached field after a root is taken invalidates the cache"""
+        changes = {
+            "slot": 123457,
+            "proposer_index": 7,
+            "parent_root": sha256(b"new parent").digest(),
+            "body_root": sha256(b"new body").digest(),
+        }
+        for name, value in changes.items():
+            self.header.root_with_state_root(ZERO_STATE_ROOT)
+            setattr(self.header, name, value)
+            for state_root in (ZERO_STATE_ROOT, self.header.state_root):
+                self.assertEqual(self.header.root_with_state_root(state_root),
+                                 _generic_root(self.header, state_root), name)
+
+
+class TestRepeatedProofs(unittest.TestCase):
+    """Proofs on the same in-memory state do not depend on earlier proofs."""
+
+    def test_same_state_twice(self):
+        """Repeated validator and balance proofs on one state match a fresh state"""
+        state = load_and_process_state(STATE_FILE)
+        header_state_root = state.latest_block_header.state_root
+        for generate in (generate_validator_proof_from_state, generate_balance_proof_from_state):
+            expected = generate(load_and_process_state(STATE_FILE), 3)
+            for _ in range(2):
+                result = generate(state, 3)
+                self.assertEqual(result.proof, expected.proof)
+                self.assertEqual(result.root, expected.root)
+                self.assertEqual(result.metadata, expected.metadata)
+        self.assertEqual(state.latest_block_header.state_root, header_state_root)
+
+
+if __name__ == "__main__":
+    unittest.main()
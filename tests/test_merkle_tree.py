@@ -0,0 +1,83 @@
+"""
+Tests for IncrementalMerkleTree
+
+Verifies that the incremental tree produces the same proofs and roots as the
+one-shot fixed-capacity helpers, both when built and after leaf updates.
+"""
+
+import unittest
+import sys
+import os
+from hashlib import sha256
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bera_proofs.ssz import (
+    IncrementalMerkleTree,
+    get_fixed_capacity_proof,
+    merkle_root_list_fixed,
+    VALIDATOR_REGISTRY_LIMIT,
+)
+
+
+def _leaves(n, salt=b""):
+    return [sha256(salt + i.to_bytes(8, "little")).digest() for i in range(n)]
+
+
+class TestIncrementalMerkleTree(unittest.TestCase):
+    """Compare IncrementalMerkleTree against the fixed-capacity functions."""
+
+    def assertMatchesFixed(self, tree, leaves, capacity):
+        self.assertEqual(tree.root(), merkle_root_list_fixed(leaves, capacity))
+        for i in range(len(leaves)):
+            self.assertEqual(tree.proof(i), get_fixed_capacity_proof(leaves, i, capacity))
+
+    def test_build_matches_fixed_capacity(self):
+        """Fresh trees match for odd, even and power-of-two leaf counts"""
+        for n in (1, 2, 3, 7, 8, 33):
+            leaves = _leaves(n)
+            tree = IncrementalMerkleTree(leaves, VALIDATOR_REGISTRY_LIMIT)
+            self.assertMatchesFixed(tree, leaves, VALIDATOR_REGISTRY_LIMIT)
+
+    def test_update_and_sync(self):
+        """Changed leaves are rehashed in place; grown lists append; shrunk lists rebuild"""
+        leaves = _leaves(21)
+        tree = IncrementalMerkleTree(leaves, 1024)
+
+        leaves[20] = sha256(b"last").digest()
+        leaves[3] = sha256(b"third").digest()
+        self.assertEqual(tree.sync(leaves), 2)
+        self.assertMatchesFixed(tree, leaves, 1024)
+
+        leaves.append(sha256(b"new").digest())
+        self.assertEqual(tree.sync(leaves), 1)
+        self.assertMatchesFixed(tree, leaves, 1024)
+
+        leaves.extend(_leaves(12, b"more"))
+        leaves[0] = sha256(b"first").digest()
+        self.assertEqual(tree.sync(leaves), 13)
+        self.assertMatchesFixed(tree, leaves, 1024)
+
+        del leaves[5:]
+        self.assertEqual(tree.sync(leaves), len(leaves))
+        self.assertMatchesFixed(tree, leaves, 1024)
+
+    def test_empty_and_invalid(self):
+        """Empty trees give the zero root; bad inputs raise"""
+        self.assertEqual(IncrementalMerkleTree([], 8).root(), merkle_root_list_fixed([], 8))
+        with self.assertRaises(ValueError):
+            IncrementalMerkleTree(_leaves(2), 6)
+        with self.assertRaises(IndexError):
+            IncrementalMerkleTree(_leaves(2), 8).proof(2)
+
+    def test_trailing_zero_chunks(self):
+        """Trailing zero chunks hash the same as the implicit zero padding"""
+        zero = b"\0" * 32
+        for leaves in ([zero] * 5, _leaves(3) + [zero] * 6, [zero] + _leaves(2) + [zero] * 13):
+            tree = IncrementalMerkleTree(leaves, 64)
+            self.assertEqual(merkle_root_list_fixed(leaves, 64), tree.root())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Tests for the in-process state cache
+
+Verifies that states handed out by load_and_process_state are independent
+working copies, that proofs on them match an uncached state, and that the
+cache is keyed on the file's modification time and size.
+"""
+
+import unittest
+import sys
+import os
+import json
+import shutil
+import tempfile
+from hashlib import sha256
+from unittest import mock
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bera_proofs import main
+from bera_proofs.main import (
+    generate_balance_proof_from_state,
+    generate_validator_proof_from_state,
+    load_and_process_state,
+)
+from bera_proofs.ssz.containers.utils import process_state_dict
+
+STATE_FILE = os.path.join(os.path.dirname(__file__), '..', 'test', 'data', 'state.json')
+
+
+def _uncached_state():
+    with open(STATE_FILE) as f:
+        return process_state_dict(json.load(f)["data"])
+
+
+def _roots(salt):
+    return "0x" + sha256(b"state" + salt).hexdigest(), "0x" + sha256(b"block" + salt).hexdigest()
+
+
+class TestStateCache(unittest.TestCase):
+    """Compare cached working copies against freshly decoded states."""
+
+    def setUp(self):
+        main._state_cache.clear()
+
+    def assertSameResult(self, result, expected):
+        self.assertEqual(result.proof, expected.proof)
+        self.assertEqual(result.root, expected.root)
+        self.assertEqual(result.metadata, expected.metadata)
+
+    def test_copies_do_not_share_proof_writes(self):
+        """Proofs with different historical roots on two copies match uncached states"""
+        first = load_and_process_state(STATE_FILE)
+        second = load_and_process_state(STATE_FILE)
+        self.assertEqual(len(main._state_cache), 1)
+        cached = next(iter(main._state_cache.values()))
+        cached_state_roots = list(cached.state_roots)
+        cached_block_roots = list(cached.block_roots)
+        cached_header = cached.latest_block_header.merkle_tree()[-1][0]
+
+        for generate in (generate_validator_proof_from_state, generate_balance_proof_from_state):
+            for state, salt in ((first, b"a"), (second, b"b")):
+                prev_state_root, prev_block_root = _roots(salt)
+                self.assertSameResult(
+                    generate(state, 5, prev_state_root, prev_block_root),
+                    generate(_uncached_state(), 5, prev_state_root, prev_block_root),
+                )
+
+        self.assertEqual(cached.state_roots, cached_state_roots)
+        self.assertEqual(cached.block_roots, cached_block_roots)
+        self.assertEqual(cached.latest_block_header.merkle_tree()[-1][0], cached_header)
+        self.assertSameResult(
+            generate_validator_proof_from_state(load_and_process_state(STATE_FILE), 5),
+            generate_validator_proof_from_state(_uncached_state(), 5),
+        )
+
+    def test_cache_key_follows_mtime_and_size(self):
+        """A changed modification time or size reloads the file"""
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        path = os.path.join(tmpdir, "state.json")
+        shutil.copyfile(STATE_FILE, path)
+
+        with mock.patch.object(main, "_load_state", wraps=main._load_state) as load:
+            load_and_process_state(path)
+            load_and_process_state(path)
+            self.assertEqual(load.call_count, 1)
+
+            st = os.stat(path)
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            load_and_process_state(path)
+            self.assertEqual(load.call_count, 2)
+
+            st = os.stat(path)
+            with open(path, "ab") as f:
+                f.write(b"\n")
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+            load_and_process_state(path)
+            self.assertEqual(load.call_count, 3)
+
+            load_and_process_state(path)
+            self.assertEqual(load.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
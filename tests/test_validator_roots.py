@@ -0,0 +1,106 @@
+"""
+Tests for batched validator merkleization
+
+Verifies that batch_validator_roots and its inline and level-by-level
+kernels produce the same roots as the generic Validator.merkle_tree().
+"""
+
+import unittest
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from unittest import mock
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bera_proofs.ssz.containers import beacon
+from bera_proofs.ssz.containers.beacon import batch_validator_roots
+from bera_proofs.ssz.containers.utils import load_and_process_state
+
+STATE_FILE = os.path.join(os.path.dirname(__file__), '..', 'test', 'data', 'state.json')
+
+
+def _generic_roots(validators):
+    return [v.merkle_tree()[-1][0] for v in validators]
+
+
+def _fields(v):
+    return (
+        v.pubkey, v.withdrawal_credentials, v.effective_balance, v.slashed,
+        v.activation_eligibility_epoch, v.activation_epoch, v.exit_epoch, v.withdrawable_epoch,
+    )
+
+
+class TestBatchValidatorRoots(unittest.TestCase):
+    """Compare the validator root fast paths against merkle_tree()."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.validators = load_and_process_state(STATE_FILE).validators
+
+    def setUp(self):
+        beacon._validator_root_cache.clear()
+
+    def test_cold_and_warm_cache(self):
+        """Fresh roots and cached roots both match the generic tree"""
+        expected = _generic_roots(self.validators)
+        self.assertEqual(batch_validator_roots(self.validators), expected)
+        self.assertEqual(batch_validator_roots(self.validators), expected)
+        self.assertEqual([v.merkle_root() for v in self.validators], expected)
+
+    def test_partially_cached(self):
+        """A batch mixing cached and new validators keeps input order"""
+        batch_validator_roots(self.validators[::2])
+        changed = [replace(v, effective_balance=v.effective_balance + 1) for v in self.validators[:5]]
+        validators = changed + list(self.validators)
+        self.assertEqual(batch_validator_roots(validators), _generic_roots(validators))
+
+    def test_level_by_level_kernel(self):
+        """The hash_pairs batch path matches the generic tree"""
+        keys = [_fields(v) for v in self.validators]
+        expected = _generic_roots(self.validators)
+        self.assertEqual(beacon._native_validator_roots(keys), expected)
+        # Route batch_validator_roots through the same path, cold then warm
+        with mock.patch.object(beacon, "HAS_NATIVE_HASHTREE", True), \
+                mock.patch.object(beacon, "NATIVE_BATCH_MIN_VALIDATORS", 1):
+            self.assertEqual(batch_validator_roots(self.validators), expected)
+            self.assertEqual(batch_validator_roots(self.validators), expected)
+
+    def test_unusual_field_sizes(self):
+        """Short pubkeys and credentials fall back to the generic tree"""
+        v = self.validators[0]
+        odd = [
+            replace(v, pubkey=v.pubkey[:47]),
+            replace(v, withdrawal_credentials=v.withdrawal_credentials[:20]),
+            replace(v, slashed=True),
+        ]
+        expected = _generic_roots(odd)
+        self.assertEqual([beacon._validator_root(_fields(o)) for o in odd], expected)
+        self.assertEqual(batch_validator_roots(odd), expected)
+
+    def test_concurrent_eviction(self):
+        """Threads inserting into a full cache evict without errors"""
+        variants = [
+            [replace(v, effective_balance=v.effective_balance + n) for v in self.validators]
+            for n in range(16)
+        ]
+        expected = [_generic_roots(vs) for vs in variants]
+
+        def run(n):
+            return [v.merkle_root() for v in variants[n]] == expected[n] \
+                and batch_validator_roots(variants[n]) == expected[n]
+
+        # Switch threads as often as possible so unguarded iteration would race
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+        with mock.patch.object(beacon, "VALIDATOR_ROOT_CACHE_SIZE", 32):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                self.assertTrue(all(pool.map(run, list(range(16)) * 4)))
+            self.assertLessEqual(len(beacon._validator_root_cache), 32)
+
+
+if __name__ == "__main__":
+    unittest.main()